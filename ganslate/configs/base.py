@@ -11,6 +11,8 @@ class BaseDatasetConfig:
     root: str = MISSING
     num_workers: int = 4
     pin_memory: bool = True
+    # Number of batches loaded in advance by each worker, higher values mostly cost memory
+    prefetch_factor: int = 2
 
 
 ############ GAN Optimizer, Discriminator, Generator, and Framework #############
@@ -123,6 +125,10 @@ class BaseEngineConfig:
     cuda: bool = II("train.cuda")
     mixed_precision: bool = II("train.mixed_precision")
     opt_level: str = II("train.opt_level")
+    # Uses the channels last memory format (NHWC/NDHWC) for the networks, faster on tensor cores
+    channels_last: bool = II("train.channels_last")
+    # Compiles the networks with `torch.compile`, the first iterations are slower while compiling
+    compile: bool = II("train.compile")
 
     logging: LoggingConfig = II("train.logging")
 
@@ -32,6 +32,8 @@ class TrainConfig(base.BaseEngineConfig):
     cuda: bool = True
     mixed_precision: bool = False
     opt_level: str = "O1"
+    channels_last: bool = False
+    compile: bool = False
     checkpointing: TrainCheckpointingConfig = TrainCheckpointingConfig()
     logging: base.LoggingConfig = base.LoggingConfig()
     ###########################################################################
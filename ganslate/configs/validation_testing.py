@@ -57,6 +57,10 @@ class BaseValTestConfig(base.BaseEngineConfig):
     dataset: Optional[base.BaseDatasetConfig] = None
     # Val/test can have multiple datasets provided to it
     multi_dataset: Optional[Dict[str, base.BaseDatasetConfig]] = None
+    # Copy the next sample to the GPU on a side stream while the current one is processed.
+    # Two samples are then on the GPU at once, doubling the GPU memory that the (often
+    # full-volume) val/test samples take, hence disabled by default.
+    prefetch: bool = False
 
 
 @dataclass
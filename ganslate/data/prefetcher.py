@@ -0,0 +1,70 @@
+import torch
+
+
+class CUDAPrefetcher:
+    """Wraps a dataloader and copies the next batch to the GPU on a side CUDA stream
+    while the current batch is being processed, taking the host-to-device transfer
+    off the critical path. Yields the same batches as the dataloader, with all the
+    tensors (also the ones nested in dicts and lists) already placed on the `device`.
+    If `keys` are given, only those entries of a dict batch are placed on the `device`,
+    the rest (e.g. metadata used for saving) stays on the CPU.
+    """
+
+    def __init__(self, data_loader, device, keys=None):
+        self.data_loader = data_loader
+        self.dataset = data_loader.dataset
+        self.device = device
+        self.keys = keys
+        self.stream = torch.cuda.Stream(device=device)
+
+    def __iter__(self):
+        loader_iter = iter(self.data_loader)
+        batch = self._preload(loader_iter)
+        while batch is not None:
+            current_stream = torch.cuda.current_stream(self.device)
+            # Wait for the copy of the batch to finish before the batch is used
+            current_stream.wait_stream(self.stream)
+            # Tensors allocated on the side stream are now used on the current one, letting
+            # the caching allocator know prevents reusing their memory too early
+            _record_stream(batch, current_stream)
+            # Start copying the next batch while the current one is being processed
+            next_batch = self._preload(loader_iter)
+            yield batch
+            batch = next_batch
+
+    def __len__(self):
+        return len(self.data_loader)
+
+    def _preload(self, loader_iter):
+        try:
+            batch = next(loader_iter)
+        except StopIteration:
+            return None
+        with torch.cuda.stream(self.stream):
+            if self.keys is not None:
+                return {k: _to_device(v, self.device) if k in self.keys else v
+                        for k, v in batch.items()}
+            return _to_device(batch, self.device)
+
+
+def _to_device(obj, device):
+    if torch.is_tensor(obj):
+        return obj.to(device, non_blocking=True)
+    elif isinstance(obj, dict):
+        return {k: _to_device(v, device) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [_to_device(v, device) for v in obj]
+    return obj
+
+
+def _record_stream(obj, stream):
+    # Only the tensors moved to the GPU, entries left on the CPU (see `keys`) have no stream
+    if torch.is_tensor(obj):
+        if obj.is_cuda:
+            obj.record_stream(stream)
+    elif isinstance(obj, dict):
+        for v in obj.values():
+            _record_stream(v, stream)
+    elif isinstance(obj, list):
+        for v in obj:
+            _record_stream(v, stream)
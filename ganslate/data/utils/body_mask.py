@@ -1,3 +1,6 @@
+import os
+from pathlib import Path
+
 from scipy import ndimage
 import cv2
 import numpy as np
@@ -69,19 +72,24 @@ def get_body_mask(image: np.ndarray, hu_threshold: int) -> np.ndarray:
     # Integer labels of components start from 1. Background is 0.
     connected_components, _ = ndimage.label(binarized_image)
 
-    # Get counts for each component in the connected component analysis
-    label_counts = [
-        np.sum(connected_components == label) for label in range(1,
-                                                                 connected_components.max() + 1)
-    ]
+    # Get counts for each component in the connected component analysis,
+    # counted in a single pass over the label map. Background (label 0) is skipped.
+    label_counts = np.bincount(connected_components.ravel())[1:]
     max_label = np.argmax(label_counts) + 1
 
     # Image with largest component binary mask
     binarized_image = connected_components == max_label
 
-    for z in range(binarized_image.shape[0]):
+    # Contours are searched for only within the bounding box of the largest component,
+    # expanded by a voxel so that the component does not touch the border of the crop
+    z_bound, y_bound, x_bound = ndimage.find_objects(connected_components)[max_label - 1]
+    y_min, y_max = max(y_bound.start - 1, 0), min(y_bound.stop + 1, image.shape[1])
+    x_min, x_max = max(x_bound.start - 1, 0), min(x_bound.stop + 1, image.shape[2])
+
+    # Slices outside of the bounding box have no contours
+    for z in range(z_bound.start, z_bound.stop):
 
-        binary_slice = np.uint8(binarized_image[z])
+        binary_slice = np.uint8(binarized_image[z, y_min:y_max, x_min:x_max])
 
         # Find contours for each binary slice
         try:
@@ -98,8 +106,50 @@ def get_body_mask(image: np.ndarray, hu_threshold: int) -> np.ndarray:
         smoothed_contour = smooth_contour_points(largest_contour)
 
         # Project the points onto the body_mask image, everything
-        # inside the points is set to 1.
-        cv2.drawContours(body_mask[z], [smoothed_contour], -1, 1, -1)
+        # inside the points is set to 1. Offset maps the points from the crop to the slice.
+        cv2.drawContours(body_mask[z], [smoothed_contour], -1, 1, -1, offset=(x_min, y_min))
+
+    return body_mask
+
+
+def get_cached_body_mask(image: np.ndarray, hu_threshold: int, cache_dir,
+                         source_path) -> np.ndarray:
+    """
+    Same as `get_body_mask`, but the mask is stored in `cache_dir` (.npy) when
+    generated and loaded from it afterwards instead of being generated again.
+    The mask is returned as uint8.
+
+    Parameters
+    -------------
+    image: Numpy array to get the mask from, loaded from `source_path`
+    hu_threshold: Set threshold to binarize image
+    cache_dir: Directory to store the masks in, created if it does not exist
+    source_path: File of the image. Its name, modification time and the `hu_threshold` identify
+    the cached mask, so that a mask is generated again when any of them changes.
+    """
+    source_path = Path(source_path)
+    mtime = os.stat(source_path).st_mtime_ns
+    cache_name = f"{source_path.parent.name}_{source_path.name}_hu{hu_threshold}_{mtime}.npy"
+    cache_path = Path(cache_dir) / cache_name
+    if cache_path.is_file():
+        return np.load(cache_path)
+
+    body_mask = get_body_mask(image, hu_threshold).astype(np.uint8)
+
+    # Write to a temporary file and then rename it, so that a partially written
+    # cache is never read by another process (e.g. another dataloader worker)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as file:
+            np.save(file, body_mask)
+        os.replace(tmp_path, cache_path)
+    except OSError as error:
+        logger.warning(f"Could not cache the body mask to `{cache_path}`: {error}")
+    finally:
+        # Left behind only if writing or renaming it failed
+        if tmp_path.exists():
+            tmp_path.unlink()
 
     return body_mask
 
@@ -18,30 +18,28 @@ def truncate_CBCT_based_on_fov(image: sitk.Image):
     ----------------
     filtered_image: Truncated CBCT image
     """
-    array = sitk.GetArrayFromImage(image)
+    # View of the image's buffer, it is only read
+    array = sitk.GetArrayViewFromImage(image)
     start_idx, end_idx = 0, array.shape[0]
 
-    begin_truncate = False
-
-    for idx, slice in enumerate(array):
-
-        # Calculate the percentage FOV.
-        # This should give an estimate of difference between
-        # area of the z-axis rectangular slice and circle formed by
-        # the FOV. Eg. 400x400 will have 160k area and if the FOV is
-        # an end to end circle then it will have an area of 3.14*200*200
-        percentage_fov = 1 - np.mean(slice == -1024)
-        # As soon as the percentage of fov in the image
-        # is above 75% of the image set the start index.
-        if percentage_fov > 0.75 and start_idx == 0:
-            start_idx = idx
-            begin_truncate = True
-
-        # Once the start index is set and the fov percentage
-        # goes below 75% set the end index
-        if begin_truncate and percentage_fov < 0.75:
-            end_idx = idx - 1
-            break
+    # Calculate the percentage FOV of all slices at once.
+    # This should give an estimate of difference between
+    # area of the z-axis rectangular slice and circle formed by
+    # the FOV. Eg. 400x400 will have 160k area and if the FOV is
+    # an end to end circle then it will have an area of 3.14*200*200
+    percentage_fov = 1 - np.mean(array == -1024, axis=(1, 2))
+
+    # The start index is the first slice whose percentage
+    # of fov in the image is above 75% of the image.
+    full_fov_idxs = np.flatnonzero(percentage_fov > 0.75)
+    if full_fov_idxs.size > 0:
+        start_idx = int(full_fov_idxs[0])
+
+        # After the start index, the end index is set where
+        # the fov percentage goes below 75%
+        small_fov_idxs = np.flatnonzero(percentage_fov[start_idx:] < 0.75)
+        if small_fov_idxs.size > 0:
+            end_idx = start_idx + int(small_fov_idxs[0]) - 1
 
     image = sitk_utils.slice_image(image, start=(0, 0, start_idx), end=(-1, -1, end_idx))
 
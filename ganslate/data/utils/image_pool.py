@@ -1,4 +1,3 @@
-import random
 import torch
 
 
@@ -16,10 +15,11 @@ class ImagePool():
             pool_size (int) -- the size of image buffer, if pool_size=0, no buffer will be created
         """
         self.pool_size = pool_size
-        # Create an empty pool
+        # Create an empty pool, the buffer is allocated on the first query when
+        # the shape, dtype and device of the images are known
         if self.pool_size > 0:
             self.num_imgs = 0
-            self.images = []
+            self.images = None
 
     def query(self, images):
         """Return an image from the pool.
@@ -35,26 +35,42 @@ class ImagePool():
         """
         if self.pool_size == 0:  # if the buffer size is 0, do nothing
             return images
-        return_images = []
-        for image in images:
-            image = torch.unsqueeze(image.data, 0)
-            # If the buffer is not full, keep inserting current images to the buffer
-            if self.num_imgs < self.pool_size:
-                self.num_imgs = self.num_imgs + 1
-                self.images.append(image)
-                return_images.append(image)
-            else:
-                p = random.uniform(0, 1)
-                # By 50% chance, the buffer will return a previously stored image,
-                # and insert the current image into the buffer
-                if p > 0.5:
-                    random_id = random.randint(0, self.pool_size - 1)
-                    tmp = self.images[random_id].clone()
-                    self.images[random_id] = image
-                    return_images.append(tmp)
-                # By another 50% chance, the buffer will return the current image
-                else:
-                    return_images.append(image)
+
+        images = images.detach()
+        if self.images is None:
+            self.images = torch.empty((self.pool_size, *images.shape[1:]),
+                                      dtype=images.dtype,
+                                      device=images.device)
+        elif images.shape[1:] != self.images.shape[1:] or images.dtype != self.images.dtype:
+            # Would otherwise be silently broadcasted or cast into the buffer
+            raise ValueError(f"ImagePool stores images of shape {tuple(self.images.shape[1:])} and "
+                             f"dtype {self.images.dtype}, but got images of shape "
+                             f"{tuple(images.shape[1:])} and dtype {images.dtype}.")
+
+        # If the buffer is not full, keep inserting current images to the buffer
+        num_inserted = min(self.pool_size - self.num_imgs, len(images))
+        if num_inserted > 0:
+            self.images[self.num_imgs:self.num_imgs + num_inserted] = images[:num_inserted]
+            self.num_imgs += num_inserted
+
+        inserted, images = images[:num_inserted], images[num_inserted:]
+        if len(images) == 0:
+            return inserted
+
+        # Pick a distinct buffer slot for each of the remaining images
+        if len(images) <= self.pool_size:
+            random_ids = torch.randperm(self.pool_size, device=images.device)[:len(images)]
+        else:
+            random_ids = torch.randint(self.pool_size, (len(images),), device=images.device)
+        stored = self.images[random_ids]
+
+        # By 50% chance, the buffer will return a previously stored image,
+        # and insert the current image into the buffer.
+        # By another 50% chance, the buffer will return the current image.
+        swap = torch.rand(len(images), device=images.device) > 0.5
+        swap = swap.view(-1, *[1] * (images.dim() - 1))
+        self.images[random_ids] = torch.where(swap, images, stored)
+        return_images = torch.where(swap, stored, images)
+
         # Collect all the images and return
-        return_images = torch.cat(return_images, 0)
-        return return_images
+        return torch.cat([inserted, return_images], 0)
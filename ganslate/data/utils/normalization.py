@@ -1,18 +1,31 @@
 import torch
 
 
+def _get_normalization_scale_and_offset(min_value, max_value):
+    """Rescaling from [min_value, max_value] to [-1, 1] as a single `image * scale + offset`."""
+    scale = 2 / (max_value - min_value)
+    offset = -1 - min_value * scale
+    return scale, offset
+
+
 def min_max_normalize(image, min_value, max_value):
-    image = image.float()
-    image = (image - min_value) / (max_value - min_value)
-    return 2 * image - 1
+    # Only the scaling allocates a new tensor (leaving the input untouched),
+    # shifting to [-1, 1] is then done in-place on it
+    scale, offset = _get_normalization_scale_and_offset(min_value, max_value)
+    return image.float().mul(scale).add_(offset)
+
+
+def clip_and_min_max_normalize(image, min_value, max_value):
+    # Rescaling is monotonic, so clipping the rescaled image to [-1, 1] is the same as
+    # clipping the image to [min_value, max_value] first. Allows a single allocation.
+    scale, offset = _get_normalization_scale_and_offset(min_value, max_value)
+    return image.float().mul(scale).add_(offset).clamp_(-1, 1)
 
 
 def min_max_denormalize(image, min_value, max_value):
-    image += 1
-    image /= 2
-    image *= (max_value - min_value)
-    image += min_value
-    return image
+    # In-place inverse of the rescaling, `(image + 1) / 2 * (max_value - min_value) + min_value`
+    scale = (max_value - min_value) / 2
+    return image.mul_(scale).add_(min_value + scale)
 
 
 def z_score_normalize(tensor, scale_to_range=None):
@@ -3,13 +3,14 @@ import numpy as np
 
 def pad(volume, target_shape):
     assert len(target_shape) == len(volume.shape)
-    # By default no padding
-    pad_width = [(0, 0) for _ in range(len(target_shape))]
+    # Padding needed per dimension, none for dimensions already as large as the target
+    pad_total = np.maximum(np.array(target_shape) - np.array(volume.shape), 0)
 
-    for dim in range(len(target_shape)):
-        if target_shape[dim] > volume.shape[dim]:
-            pad_total = target_shape[dim] - volume.shape[dim]
-            pad_per_side = pad_total // 2
-            pad_width[dim] = (pad_per_side, pad_total % 2 + pad_per_side)
+    # Skip copying the volume (and computing its min) when no padding is needed
+    if not pad_total.any():
+        return volume
 
-    return np.pad(volume, pad_width, 'constant', constant_values=volume.min())
\ No newline at end of file
+    pad_before = pad_total // 2
+    pad_after = pad_total - pad_before
+    pad_width = list(zip(pad_before, pad_after))
+    return np.pad(volume, pad_width, 'constant', constant_values=volume.min())
@@ -37,38 +37,39 @@ class StochasticFocalPatchSampler:
 
     def patch_and_focal_point_from_A(self, volume):
         """Return random patch from volume A and its relative start position."""
-        z, x, y = self.pick_random_start(volume)
+        # Computed once and passed to the helpers that need it
+        volume_size = self.get_size(volume)
+        z, x, y = self.pick_random_start(volume_size)
         # start + patch size for each coord
         z_end, x_end, y_end = [sum(pair) for pair in zip((z, x, y), self.patch_size)]
 
         patch = volume[z:z_end, x:x_end, y:y_end]
-        relative_focal_point = self.calculate_relative_focal_point(z, x, y, volume)
+        relative_focal_point = self.calculate_relative_focal_point(z, x, y, volume_size)
         return patch, relative_focal_point
 
     def patch_from_B(self, volume, relative_focal_point):
         """Return random patch from volume B that is in relative neighborhood of patch_A."""
-        z, x, y = self.pick_stochastic_focal_start(volume, relative_focal_point)
+        z, x, y = self.pick_stochastic_focal_start(self.get_size(volume), relative_focal_point)
         # start + patch size for each coord
         z_end, x_end, y_end = [sum(pair) for pair in zip((z, x, y), self.patch_size)]
 
         patch = volume[z:z_end, x:x_end, y:y_end]
         return patch
 
-    def pick_random_start(self, volume):
+    def pick_random_start(self, volume_size):
         """Pick a starting point of a patch randomly. Used for patch_A."""
-        valid_start_region = self.calculate_valid_start_region(volume)
+        valid_start_region = self.calculate_valid_start_region(volume_size)
         z, x, y = [random.randint(0, v) for v in valid_start_region]
         return z, x, y
 
-    def pick_stochastic_focal_start(self, volume, relative_focal_point):
+    def pick_stochastic_focal_start(self, volume_size, relative_focal_point):
         """Pick a starting point of a patch with regards to the focal point neighborhood. Used for patch_B."""
-        volume_size = self.get_size(volume)
         focal_region = self.focal_region_proportion * volume_size
         focal_region = focal_region.astype(np.int64)
 
         # Map relative point to corresponding point in this volume
         focal_point = relative_focal_point * volume_size
-        valid_start_region = self.calculate_valid_start_region(volume)
+        valid_start_region = self.calculate_valid_start_region(volume_size)
 
         z, x, y = self.apply_stochastic_focal_method(focal_point, focal_region, valid_start_region)
         return z, x, y
@@ -94,17 +95,15 @@ class StochasticFocalPatchSampler:
 
         return start_point
 
-    def calculate_relative_focal_point(self, z, x, y, volume):
+    def calculate_relative_focal_point(self, z, x, y, volume_size):
         """Relative location of starting point. Obtained by dividing position coordinates with volume size"""
-        volume_size = self.get_size(volume)
         focal_point = np.array([z, x, y])
 
         relative_focal_point = focal_point / volume_size
         return relative_focal_point
 
-    def calculate_valid_start_region(self, volume):
+    def calculate_valid_start_region(self, volume_size):
         """Patch can have a starting coordinate anywhere from where it can fit with the defined patch size."""
-        volume_size = self.get_size(volume)
         valid_start_region = volume_size - self.patch_size
 
         if np.any(valid_start_region < 0):
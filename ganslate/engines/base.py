@@ -32,7 +32,7 @@ class BaseEngineWithInference(BaseEngine):
         self.sliding_window_inferer = self._init_sliding_window_inferer()
 
     def infer(self, data, *args, **kwargs):
-        data = data.to(self.model.device)
+        data = self.model.input_to_device(data)
         # Sliding window (i.e. patch-wise) inference
         if self.sliding_window_inferer:
             return self.sliding_window_inferer(data, self.model.infer, *args, **kwargs)
@@ -1,6 +1,7 @@
 from loguru import logger
 
 import torch
+from ganslate.data.prefetcher import CUDAPrefetcher
 from ganslate.engines.base import BaseEngine
 from ganslate.engines.validator_tester import Validator
 from ganslate.utils import communication, environment
@@ -13,6 +14,7 @@ class Trainer(BaseEngine):
     def __init__(self, conf):
         super().__init__(conf)
         environment.setup_logging_with_config(conf)
+        self.is_main_process = communication.get_rank() == 0
 
         # https://stackoverflow.com/a/58965640
         torch.backends.cudnn.benchmark = True
@@ -27,6 +29,10 @@ class Trainer(BaseEngine):
 
         self.model = build_gan(self.conf)
 
+        # Overlap the host-to-GPU copy of the next batch with the current iteration
+        if self.model.device.type == 'cuda':
+            self.data_loader = CUDAPrefetcher(self.data_loader, self.model.device)
+
         # Validation configuration and validation dataloader specified.
         self.validator = self._init_validator()
 
@@ -41,6 +47,13 @@ class Trainer(BaseEngine):
         self.iters = range(start_iter, end_iter)
         self.iter_idx = 0
 
+        # Frequencies checked every iteration, read from the config only once
+        self.checkpoint_freq = self.conf.train.checkpointing.freq
+        self.checkpoint_after = self.conf.train.checkpointing.start_after
+        if self.validator:
+            self.val_freq = self.conf.val.freq
+            self.val_after = self.conf.val.start_after
+
     def _set_mode(self):
         self.conf.mode = "train"
 
@@ -84,10 +97,8 @@ class Trainer(BaseEngine):
 
     def _save_checkpoint(self):
         # TODO: save on cancel
-        if communication.get_rank() == 0:
-            checkpoint_freq = self.conf.train.checkpointing.freq
-            checkpoint_after = self.conf.train.checkpointing.start_after
-            if self.iter_idx % checkpoint_freq == 0 and self.iter_idx >= checkpoint_after:
+        if self.is_main_process:
+            if self.iter_idx % self.checkpoint_freq == 0 and self.iter_idx >= self.checkpoint_after:
                 self.logger.info(f'Saving the model after {self.iter_idx} iterations.')
                 self.model.save_checkpoint(self.iter_idx)
 
@@ -102,9 +113,7 @@ class Trainer(BaseEngine):
 
     def _run_validation(self):
         if self.validator:
-            val_freq = self.conf.val.freq
-            val_after = self.conf.val.start_after
-            if self.iter_idx % val_freq == 0 and self.iter_idx >= val_after:
+            if self.iter_idx % self.val_freq == 0 and self.iter_idx >= self.val_after:
                 self.validator.run(current_idx=self.iter_idx)
 
     def _set_iter_idx(self, iter_idx):
@@ -1,3 +1,4 @@
+from ganslate.data.prefetcher import CUDAPrefetcher
 from ganslate.engines.base import BaseEngineWithInference
 from ganslate.utils.metrics.val_test_metrics import ValTestMetrics
 from ganslate.utils import environment
@@ -20,6 +21,19 @@ class BaseValTestEngine(BaseEngineWithInference):
         self.tracker = ValTestTracker(self.conf)
         self.metricizer = ValTestMetrics(self.conf)
         self.visuals = {}
+        self.prefetch = False
+
+    def _init_prefetchers(self):
+        """Overlap the host-to-GPU copy of the next sample with the inference on the current one,
+        if enabled. Called once the model is set. Only the inputs and targets are copied, the rest
+        is used on CPU.
+        """
+        self.prefetch = self.conf[self.conf.mode].prefetch and self.model.device.type == 'cuda'
+        if self.prefetch:
+            self.data_loaders = {
+                name: CUDAPrefetcher(data_loader, self.model.device, keys=("A", "B"))
+                for name, data_loader in self.data_loaders.items()
+            }
 
     def run(self, current_idx=None):
         self.logger.info(f'{"Validation" if self.conf.mode == "val" else "Testing"} started.')
@@ -27,12 +41,13 @@ class BaseValTestEngine(BaseEngineWithInference):
         for dataset_name, data_loader in self.data_loaders.items():
             self.current_data_loader = data_loader
             for data in self.current_data_loader:
-                # Collect visuals
-                device = self.model.device
+                # Collect visuals. The target is moved the same way as the input so that both
+                # have the same memory format. When prefetched, they are already on the device
+                # and only converted to channels last, if enabled.
                 self.visuals = {}
-                self.visuals["real_A"] = data["A"].to(device)
+                self.visuals["real_A"] = self.model.input_to_device(data["A"])
                 self.visuals["fake_B"] = self.infer(self.visuals["real_A"])
-                self.visuals["real_B"] = data["B"].to(device)
+                self.visuals["real_B"] = self.model.input_to_device(data["B"])
 
                 # Add masks if provided
                 if "masks" in data:
@@ -119,6 +134,7 @@ class Validator(BaseValTestEngine):
     def __init__(self, conf, model):
         super().__init__(conf)
         self.model = model
+        self._init_prefetchers()
 
     def _set_mode(self):
         self.conf.mode = 'val'
@@ -130,6 +146,7 @@ class Tester(BaseValTestEngine):
         super().__init__(conf)
         environment.setup_logging_with_config(self.conf)
         self.model = build_gan(self.conf)
+        self._init_prefetchers()
 
     def _set_mode(self):
         self.conf.mode = 'test'
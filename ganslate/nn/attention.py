@@ -33,12 +33,14 @@ class SelfAttentionBlock(nn.Module):
                 attention: B X N X N (N is Depth*Width*Height)
         """
         m_batchsize, C, depth, width, height = x.size()
-        proj_query = self.query_conv(x).view(m_batchsize, -1,
-                                             depth * width * height).permute(0, 2, 1)  # B X CX(N)
-        proj_key = self.key_conv(x).view(m_batchsize, -1, depth * width * height)  # B X C x (D*W*H)
+        # Reshaped and not viewed, as the convolutions output channels last tensors when
+        # the networks are converted to that memory format
+        proj_query = self.query_conv(x).reshape(m_batchsize, -1,
+                                                depth * width * height).permute(0, 2, 1)  # B X CX(N)
+        proj_key = self.key_conv(x).reshape(m_batchsize, -1, depth * width * height)  # B X C x (D*W*H)
         energy = torch.bmm(proj_query, proj_key)  # transpose check
         attention = self.softmax(energy)  # BX (N) X (N)
-        proj_value = self.value_conv(x).view(m_batchsize, -1, depth * width * height)  # B X C X N
+        proj_value = self.value_conv(x).reshape(m_batchsize, -1, depth * width * height)  # B X C X N
 
         out = torch.bmm(proj_value, attention.permute(0, 2, 1))
         out = out.view(m_batchsize, C, depth, width, height)
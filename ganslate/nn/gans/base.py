@@ -39,6 +39,11 @@ class BaseGAN(ABC):
         self.is_train = self.conf.mode == "train"
         self.device = self._specify_device()
         self.output_dir = conf[conf.mode].output_dir
+        # Config values used every iteration, accessing them through OmegaConf is comparatively slow
+        self.mixed_precision = conf[conf.mode].mixed_precision
+        self.norm_type = conf.train.gan.norm_type
+        # Bound once so that the networks and their inputs always use the same memory format
+        self.channels_last = conf[conf.mode].channels_last
 
         self.visuals = {}
         self.metrics = {}
@@ -108,14 +113,15 @@ class BaseGAN(ABC):
     def setup(self):
         """Set up a GAN model. Does the following:
             (1) Initialize its networks, criterions, optimizers, metrics and schedulers
-            (2) Converts the networks to mixed precision, if specified
+            (2) Converts the networks to channels last memory format and mixed precision, if specified
             (3) Loads a checkpoint if continuing training or inferencing
             (4) Applies parallelization to the model if possible
+            (5) Compiles the networks, if specified
         """
         assert 'G' or 'G_AB' in self.networks.keys(), \
             "The (main) generator has to be named `G` or `G_AB`."
 
-        if self.conf[self.conf.mode].mixed_precision:
+        if self.mixed_precision:
             try:
                 from apex import amp
             except ModuleNotFoundError:
@@ -128,6 +134,9 @@ class BaseGAN(ABC):
         # Initialize Generators and Discriminators
         self.init_networks()
 
+        if self.channels_last:
+            self.convert_to_channels_last()
+
         if self.is_train:
             # Intialize loss functions (criterions) and optimizers
             self.init_criterions()
@@ -140,7 +149,7 @@ class BaseGAN(ABC):
                 raise ValueError(
                     "When inferring there should be only one network initialized - generator.")
 
-        if self.conf[self.conf.mode].mixed_precision:
+        if self.mixed_precision:
             self.convert_to_mixed_precision()
 
         if self.conf[self.conf.mode].checkpointing.load_iter:
@@ -150,6 +159,9 @@ class BaseGAN(ABC):
         if num_devices > 1:
             self.parallelize_networks()
 
+        if self.conf[self.conf.mode].compile:
+            self.compile_networks()
+
         torch.cuda.empty_cache()
 
     def backward(self, loss, optimizer, retain_graph=False, loss_id=0):
@@ -163,7 +175,7 @@ class BaseGAN(ABC):
                              By initializing Amp with `num_losses=1` and setting `loss_id=0` for each loss, 
                              it will use a global scaler for all losses.
         """
-        if self.conf[self.conf.mode].mixed_precision:
+        if self.mixed_precision:
             with amp.scale_loss(loss, optimizer, loss_id) as scaled_loss:
                 scaled_loss.backward(retain_graph=retain_graph)
         else:
@@ -188,6 +200,36 @@ class BaseGAN(ABC):
                 )
                 raise RuntimeError(message)
 
+    def compile_networks(self):
+        """Compile the networks with `torch.compile`, which fuses their operations into fewer kernels.
+        Done last in the setup, so that the checkpoint is loaded into and the parallelization is
+        applied on the original networks. The default mode is used as the CUDA graphs of the
+        `reduce-overhead` mode overwrite the outputs of a network when it is called again in the
+        same iteration, while the GANs keep them for the losses (e.g. fakes and reconstructions).
+        """
+        for name, network in self.networks.items():
+            self.networks[name] = torch.compile(network)
+
+    def convert_to_channels_last(self):
+        """Convert the networks' weights to the channels last memory format, which lets
+        cuDNN pick the faster NHWC convolution kernels on GPUs with tensor cores.
+        The 3D variant of the format is used for networks with volumetric weights.
+        """
+        for name, network in self.networks.items():
+            is_3d = any(param.dim() == 5 for param in network.parameters())
+            memory_format = torch.channels_last_3d if is_3d else torch.channels_last
+            self.networks[name] = network.to(memory_format=memory_format)
+
+    def input_to_device(self, tensor):
+        """Move an input to the model's device. If the networks were converted to the channels last
+        memory format, the input is converted to it too, sparing the networks' first convolution
+        from converting its input's layout on every call.
+        """
+        memory_format = torch.preserve_format
+        if self.channels_last and tensor.dim() in (4, 5):
+            memory_format = torch.channels_last_3d if tensor.dim() == 5 else torch.channels_last
+        return tensor.to(self.device, non_blocking=True, memory_format=memory_format)
+
     def convert_to_mixed_precision(self):
         """Initializes Nvidia Apex Mixed Precision
         Parameters:
@@ -235,6 +277,8 @@ class BaseGAN(ABC):
 
         # add all networks to checkpoint
         for name, net in self.networks.items():
+            # Compiled networks keep the original network, which has the state_dict without prefixes
+            net = getattr(net, "_orig_mod", net)
             if isinstance(net, DistributedDataParallel):
                 checkpoint[name] = net.module.state_dict()  # e.g. checkpoint["D_A"]
             else:
@@ -245,7 +289,7 @@ class BaseGAN(ABC):
         checkpoint['optimizer_D'] = self.optimizers['D'].state_dict()
 
         # save apex mixed precision
-        if self.conf[self.conf.mode].mixed_precision:
+        if self.mixed_precision:
             checkpoint['amp'] = amp.state_dict()
 
         torch.save(checkpoint, checkpoint_path)
@@ -266,7 +310,7 @@ class BaseGAN(ABC):
         # load amp state
         # TODO: what about opt_level, does it matter if it's different from before?
         # TODO: what if trained per-loss loss-scale and now using global or vice versa? Just reset it, i.e. ignore the amp state_dict?
-        if self.conf[self.conf.mode].mixed_precision:
+        if self.mixed_precision:
             if "amp" not in checkpoint:
                 self.logger.warning("This checkpoint was not trained using mixed precision.")
             else:
@@ -299,6 +343,23 @@ class BaseGAN(ABC):
                 for param in net.parameters():
                     param.requires_grad = requires_grad
 
+    def forward_jointly(self, network, inputs, **kwargs):
+        """Run the network once over the inputs concatenated along the batch dimension
+        instead of once per input. Returns the outputs in the order of the inputs.
+        Falls back to separate passes when the inputs cannot be concatenated or when
+        batch normalization is used, as its statistics would be mixed between the inputs.
+        Parameters:
+            network (network)       -- the network to run
+            inputs (tensor list)    -- inputs that are passed through the network
+            kwargs                  -- additional arguments of the network's forward
+        """
+        same_shape = all(x.shape[1:] == inputs[0].shape[1:] for x in inputs)
+        if not same_shape or self.norm_type == 'batch':
+            return [network(x, **kwargs) for x in inputs]
+
+        outputs = network(torch.cat(inputs, dim=0), **kwargs)
+        return torch.split(outputs, [len(x) for x in inputs], dim=0)
+
     def eval(self):
         for name in self.networks.keys():
             self.networks[name].eval()
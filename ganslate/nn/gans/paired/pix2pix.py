@@ -70,8 +70,8 @@ class Pix2PixConditionalGAN(BaseGAN):
         Parameters:
             input (dict) -- a pair of data samples from domain A and domain B.
         """
-        self.visuals['real_A'] = input['A'].to(self.device)
-        self.visuals['real_B'] = input['B'].to(self.device)
+        self.visuals['real_A'] = self.input_to_device(input['A'])
+        self.visuals['real_B'] = self.input_to_device(input['B'])
 
     def optimize_parameters(self):
         """Calculate losses, gradients, and update network weights. 
@@ -133,8 +133,8 @@ class CUT(BaseGAN):
         Parameters:
             input (dict) -- a pair of data samples from domain A and domain B.
         """
-        self.visuals['real_A'] = input['A'].to(self.device)
-        self.visuals['real_B'] = input['B'].to(self.device)
+        self.visuals['real_A'] = self.input_to_device(input['A'])
+        self.visuals['real_B'] = self.input_to_device(input['B'])
 
     def forward(self):
         using_idt = self.lambda_nce_idt > 0
@@ -289,7 +289,8 @@ class LNorm(nn.Module):
         self.power = power
 
     def forward(self, x):
-        norm = x.pow(self.power).sum(1, keepdim=True).pow(1. / self.power)
+        # Single fused reduction, no intermediate tensors for the powers and the sum
+        norm = torch.linalg.vector_norm(x, ord=self.power, dim=1, keepdim=True)
         out = x.div(norm + 1e-7)
         return out
 
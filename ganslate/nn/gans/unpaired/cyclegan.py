@@ -86,8 +86,8 @@ class CycleGAN(BaseGAN):
         Parameters:
             input (dict) -- a pair of data samples from domain A and domain B.
         """
-        self.visuals['real_A'] = input['A'].to(self.device)
-        self.visuals['real_B'] = input['B'].to(self.device)
+        self.visuals['real_A'] = self.input_to_device(input['A'])
+        self.visuals['real_B'] = self.input_to_device(input['B'])
 
     def optimize_parameters(self):
         """Calculate losses, gradients, and update network weights. 
@@ -128,20 +128,21 @@ class CycleGAN(BaseGAN):
         real_A = self.visuals['real_A']
         real_B = self.visuals['real_B']
 
+        # Visuals for Identity loss, computed in the same pass as the fakes
+        idt_B, idt_A = None, None
+        if self.criterion_G.is_using_identity():
+            fake_B, idt_B = self.forward_jointly(self.networks['G_AB'], [real_A, real_B])
+            fake_A, idt_A = self.forward_jointly(self.networks['G_BA'], [real_B, real_A])
+        else:
+            fake_B = self.networks['G_AB'](real_A)
+            fake_A = self.networks['G_BA'](real_B)
+
         # Forward cycle G_AB (A to B)
-        fake_B = self.networks['G_AB'](real_A)
         rec_A = self.networks['G_BA'](fake_B)
 
         # Backward cycle G_BA (B to A)
-        fake_A = self.networks['G_BA'](real_B)  # G forward is G_AB, G inverse forward is G_BA
         rec_B = self.networks['G_AB'](fake_A)
 
-        # Visuals for Identity loss
-        idt_B, idt_A = None, None
-        if self.criterion_G.is_using_identity():
-            idt_B = self.networks['G_AB'](real_B)
-            idt_A = self.networks['G_BA'](real_A)
-
         self.visuals.update({
             'fake_B': fake_B,
             'rec_A': rec_A,
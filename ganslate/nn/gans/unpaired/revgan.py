@@ -83,8 +83,8 @@ class RevGAN(BaseGAN):
         Parameters:
             input (dict) -- a pair of data samples from domain A and domain B.
         """
-        self.visuals['real_A'] = input['A'].to(self.device)
-        self.visuals['real_B'] = input['B'].to(self.device)
+        self.visuals['real_A'] = self.input_to_device(input['A'])
+        self.visuals['real_B'] = self.input_to_device(input['B'])
 
     def optimize_parameters(self):
         """Calculate losses, gradients, and update network weights. 
@@ -125,20 +125,22 @@ class RevGAN(BaseGAN):
         real_A = self.visuals['real_A']
         real_B = self.visuals['real_B']
 
+        # Visuals for Identity loss, computed in the same pass as the fakes
+        idt_B, idt_A = None, None
+        if self.criterion_G.is_using_identity():
+            fake_B, idt_B = self.forward_jointly(self.networks['G'], [real_A, real_B])  # G_AB
+            fake_A, idt_A = self.forward_jointly(self.networks['G'], [real_B, real_A],
+                                                 inverse=True)  # G_BA
+        else:
+            fake_B = self.networks['G'](real_A)  # G_AB
+            fake_A = self.networks['G'](real_B, inverse=True)  # G_BA
+
         # Forward cycle G_AB (A to B)
-        fake_B = self.networks['G'](real_A)  # G_AB
         rec_A = self.networks['G'](fake_B, inverse=True)  # G_BA
 
         # Backward cycle G_BA (B to A)
-        fake_A = self.networks['G'](real_B, inverse=True)  # G_BA
         rec_B = self.networks['G'](fake_A)  # G_AB
 
-        # Visuals for Identity loss
-        idt_B, idt_A = None, None
-        if self.criterion_G.is_using_identity():
-            idt_B = self.networks['G'](real_B)
-            idt_A = self.networks['G'](real_A, inverse=True)
-
         self.visuals.update({
             'fake_B': fake_B,
             'rec_A': rec_A,
@@ -181,10 +183,7 @@ class RevGAN(BaseGAN):
         self.losses[discriminator] = loss_real + loss_fake
 
         # backprop
-        self.backward(loss=self.losses[discriminator],
-                      optimizer=self.optimizers['D'],
-                      retain_graph=True,
-                      loss_id=loss_id)
+        self.backward(loss=self.losses[discriminator], optimizer=self.optimizers['D'], loss_id=loss_id)
 
     def backward_G(self):
         """Calculate the loss for generators G_AB and G_BA using all specified losses"""
@@ -68,9 +68,9 @@ class AdversarialLoss(nn.Module):
         elif self.gan_mode == 'nonsaturating':
             bs = prediction.size(0)
             if target_is_real:
-                loss = F.softplus(-prediction).view(bs, -1).mean(dim=1)
+                loss = F.softplus(-prediction).reshape(bs, -1).mean(dim=1)
             else:
-                loss = F.softplus(prediction).view(bs, -1).mean(dim=1)
+                loss = F.softplus(prediction).reshape(bs, -1).mean(dim=1)
         return loss
 
 
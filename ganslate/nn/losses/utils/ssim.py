@@ -68,8 +68,8 @@ class SSIMLoss(torch.nn.Module):
 
         # if NxCxDxHxW, convert NxC to N only giving NxDxHxW
         if X.ndim == 5:
-            X = X.view(-1, *X.shape[2:])
-            Y = Y.view(-1, *Y.shape[2:])
+            X = X.reshape(-1, *X.shape[2:])
+            Y = Y.reshape(-1, *Y.shape[2:])
         channels = X.shape[1]
 
         # Create 1D gaussian window and repeat it over channel dims
@@ -87,13 +87,15 @@ def get_scheduler(optimizer, conf):
         optimizer -- the optimizer of the network
         TODO
     """
+    # Read from the config once, the rule is evaluated at every scheduler step
+    start_iter = 1
+    if conf.train.checkpointing.load_iter:
+        start_iter += conf.train.checkpointing.load_iter
+    n_iters = conf.train.n_iters
+    n_iters_decay = conf.train.n_iters_decay
 
     def lambda_rule(iter_idx):
-        start_iter = 1
-        if conf.train.checkpointing.load_iter:
-            start_iter += conf.train.checkpointing.load_iter
-        lr_l = 1.0 - max(
-            0, iter_idx + start_iter - conf.train.n_iters) / float(conf.train.n_iters_decay + 1)
+        lr_l = 1.0 - max(0, iter_idx + start_iter - n_iters) / float(n_iters_decay + 1)
         return lr_l
 
     return lr_scheduler.LambdaLR(optimizer, lr_lambda=lambda_rule)
@@ -9,7 +9,7 @@ from ganslate.configs.config import Config
 from ganslate.configs.utils import init_config
 from ganslate.data.samplers import InfiniteSampler
 from ganslate.nn.utils import init_net
-from ganslate.utils import communication
+from ganslate.utils import communication, environment
 from ganslate.utils.io import import_attr
 
 
@@ -69,11 +69,25 @@ def build_loader(conf):
                                          shuffle=False,
                                          num_replicas=communication.get_world_size(),
                                          rank=communication.get_rank())
+
+    num_workers = conf[conf.mode].dataset.num_workers
+    # Pinned memory allows asynchronous (`non_blocking`) host-to-GPU copies, useless on CPU
+    pin_memory = conf[conf.mode].dataset.pin_memory and conf[conf.mode].cuda
+    # Prefetching is done by the workers, it cannot be set when loading in the main process
+    worker_kwargs = {}
+    if num_workers > 0:
+        worker_kwargs["prefetch_factor"] = conf[conf.mode].dataset.prefetch_factor
     return DataLoader(dataset,
                       sampler=sampler,
                       batch_size=conf[conf.mode].batch_size,
-                      num_workers=conf[conf.mode].dataset.num_workers,
-                      pin_memory=conf[conf.mode].dataset.pin_memory)
+                      # Datasets can define how their samples are batched, e.g. if they are batches themselves
+                      collate_fn=getattr(dataset, "collate_fn", None),
+                      num_workers=num_workers,
+                      worker_init_fn=environment.seed_worker,
+                      pin_memory=pin_memory,
+                      # Avoids respawning the workers each time the loader is iterated (e.g. val)
+                      persistent_workers=num_workers > 0,
+                      **worker_kwargs)
 
 
 def build_gan(conf):
@@ -1,13 +1,13 @@
 import subprocess
 import inspect
-import git
 import shutil
 from pathlib import Path
 import click
-from cookiecutter.main import cookiecutter
 from ganslate.utils.cli import cookiecutter_templates
 from ganslate.utils.cli.scripts import download_datasets
-from ganslate.engines.utils import init_engine
+
+# The engines (torch, SimpleITK, etc.), cookiecutter and git are imported only by the commands
+# that use them, so that the other commands (and `--help`) start without importing them.
 
 
 COOKIECUTTER_TEMPLATES_DIR = Path(inspect.getfile(cookiecutter_templates)).parent
@@ -22,29 +22,34 @@ def interface():
 @interface.command(help="Train a model.")
 @click.argument("omegaconf_args", nargs=-1)
 def train(omegaconf_args):
+    from ganslate.engines.utils import init_engine
     init_engine('train', omegaconf_args).run()
 
 # Test
 @interface.command(help="Test a trained model. Requires paired data.")
 @click.argument("omegaconf_args", nargs=-1)
 def test(omegaconf_args):
+    from ganslate.engines.utils import init_engine
     init_engine('test', omegaconf_args).run()
 
 # Infer
 @interface.command(help="Do inference with a trained model.")
 @click.argument("omegaconf_args", nargs=-1)
 def infer(omegaconf_args):
+    from ganslate.engines.utils import init_engine
     init_engine('infer', omegaconf_args).run()
 
 # New project
 @interface.command(help="Initialize a new project.")
 @click.argument("path", default="./")
 def new_project(path):
+    from cookiecutter.main import cookiecutter
     template = str(COOKIECUTTER_TEMPLATES_DIR / "new_project")
     cookiecutter(template, output_dir=path)
 
 # First run
 def setup_first_run(path, no_input=False, extra_context={}):
+    from cookiecutter.main import cookiecutter
     template = str(COOKIECUTTER_TEMPLATES_DIR / "your_first_run")
     project_path = cookiecutter(template, output_dir=path, no_input=no_input,\
                          overwrite_if_exists=True, extra_context=extra_context)
@@ -84,6 +89,7 @@ def install_nvidia_apex(cpp):
     # TODO: Installing with C++ support is a pain due to CUDA installations,
     # waiting for https://github.com/pytorch/pytorch/issues/40497#issuecomment-908685435
     # to switch to PyTorch AMP and get rid of Nvidia Apex
+    import git
 
     # Removes the folder if it already exists from a previous, cancelled, try.
     shutil.rmtree("./nvidia-apex-tmp", ignore_errors=True)
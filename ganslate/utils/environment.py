@@ -81,6 +81,14 @@ def set_seed(seed=0):
     os.environ['PYTHONHASHSEED'] = str(seed)
 
 
+def seed_worker(worker_id):
+    """Seeds numpy in a dataloader worker. Workers inherit the numpy random state of the
+    main process, so without it they all sample the same random numbers (e.g. patches).
+    PyTorch seeds `torch` and `random` per worker already, numpy gets a seed derived from it.
+    """
+    np.random.seed(torch.initial_seed() % 2**32)
+
+
 def setup_threading():
     """
     Sets max threads for SimpleITK and Opencv.
@@ -18,9 +18,9 @@ def make_dataset_of_files(root, extensions):
 def make_recursive_dataset_of_files(root, extensions):
     root = Path(root).resolve()
     assert root.is_dir(), f"{root} is not a valid directory"
-    paths = []
-    for ext in extensions:
-        paths.extend(list(root.rglob(f"*{ext}")))
+    # A single traversal of the directory tree for all extensions, instead of one per extension
+    extensions = tuple(extensions)
+    paths = [path for path in root.rglob("*") if path.name.endswith(extensions)]
     return sorted(paths)
 
 
@@ -21,7 +21,9 @@ class TrainingMetrics:
         if self.output_distributions:
             # Reduce the output to a tensor if it is dict
             if isinstance(out, dict):
-                out = torch.tensor([elem.detach().mean() for elem in out.values()])
+                # Stacking keeps it on the device, `torch.tensor()` would sync for each element
+                out = torch.stack([elem.detach().mean() for elem in out.values()])
+                return out.mean()
 
             else:
                 out = out.detach()
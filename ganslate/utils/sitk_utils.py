@@ -10,12 +10,25 @@ def load(file_path):
     return sitk_image
 
 
+def load_region(file_path, start, size):
+    """Load only a region of the image, starting at the `start` index (x,y,z) and of the given
+    `size` (x,y,z). Formats that support streaming (e.g. uncompressed NRRD) read only the region from
+    the disk, otherwise the image is read in full but only the region is kept in memory.
+    """
+    reader = sitk.ImageFileReader()
+    reader.SetFileName(str(file_path))
+    reader.SetExtractIndex([int(idx) for idx in start])
+    reader.SetExtractSize([int(length) for length in size])
+    return reader.Execute()
+
+
 def write(sitk_image, file_path):
     sitk.WriteImage(sitk_image, str(file_path), True)  # True is for useCompression flag
 
 
 def tensor_to_sitk_image(tensor, origin=None, spacing=None, direction=None, dtype='int16'):
-    array = tensor.cpu().numpy().astype(dtype)
+    # No copy when the tensor is already on CPU and of the requested dtype
+    array = tensor.cpu().numpy().astype(dtype, copy=False)
     sitk_image = sitk.GetImageFromArray(array)
 
     if origin is not None:
@@ -51,7 +64,8 @@ def get_npy(sitk_image):
 
 
 def get_tensor(sitk_image):
-    return torch.Tensor(get_npy(sitk_image))
+    # `from_numpy` shares the array's memory, a copy is made only if casting to float is needed
+    return torch.from_numpy(get_npy(sitk_image)).float()
 
 
 def is_image_smaller_than(sitk_image, target_size):
@@ -68,7 +82,8 @@ def is_image_smaller_than(sitk_image, target_size):
 
 
 def get_npy_dtype(sitk_image):
-    return str(sitk.GetArrayFromImage(sitk_image).dtype)
+    # A view shares the image's buffer, no need to copy the whole image to get the dtype
+    return str(sitk.GetArrayViewFromImage(sitk_image).dtype)
 
 
 def slice_image(sitk_image, start=(0, 0, 0), end=(-1, -1, -1)):
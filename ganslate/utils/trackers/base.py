@@ -1,13 +1,11 @@
 import time
 from pathlib import Path
 
+import torch
 import torchvision
 from omegaconf import OmegaConf
 from ganslate.utils import communication, io
 
-from ganslate.utils.trackers.tensorboard import TensorboardTracker
-from ganslate.utils.trackers.wandb import WandbTracker
-
 
 class BaseTracker:
     """"Base for training and inference trackers."""
@@ -16,17 +14,25 @@ class BaseTracker:
         self.conf = conf
         self.batch_size = self.conf[conf.mode].batch_size
         self.output_dir = Path(self.conf[self.conf.mode].output_dir) / self.conf.mode
+        self.is_main_process = communication.get_rank() == 0
         self.iter_idx = None
         self.iter_end_time = None
         self.iter_start_time = None
+        self.comp_end_time = None
         self.t_data = None
         self.t_comp = None
 
+        # GPU work runs asynchronously to the host, so its time is measured with CUDA events
+        self.use_cuda_events = self.conf[conf.mode].cuda and torch.cuda.is_available()
+        if self.use_cuda_events:
+            self.comp_start_event = torch.cuda.Event(enable_timing=True)
+            self.comp_end_event = torch.cuda.Event(enable_timing=True)
+
         self.wandb, self.tensorboard = self._setup_wandb_tensorboard(conf)
         self._save_config(conf)
 
     def _save_config(self, conf):
-        if communication.get_rank() == 0:
+        if self.is_main_process:
             config_path = self.output_dir / f"{self.conf.mode}_config.yaml"
             io.mkdirs(config_path.parent)
             with open(config_path, "w") as file:
@@ -34,10 +40,13 @@ class BaseTracker:
 
     def _setup_wandb_tensorboard(self, conf):
         wandb, tensorboard = None, None
-        if communication.get_rank() == 0:
+        if self.is_main_process:
+            # Imported only when used, as both libraries are slow to import
             if conf[conf.mode].logging.wandb:
+                from ganslate.utils.trackers.wandb import WandbTracker
                 wandb = WandbTracker(conf)
             if conf[conf.mode].logging.tensorboard:
+                from ganslate.utils.trackers.tensorboard import TensorboardTracker
                 tensorboard = TensorboardTracker(conf)
         return wandb, tensorboard
 
@@ -46,26 +55,43 @@ class BaseTracker:
 
     def start_computation_timer(self):
         self.iter_start_time = time.time()
+        if self.use_cuda_events:
+            self.comp_start_event.record()
 
     def start_dataloading_timer(self):
         self.iter_end_time = time.time()
 
     def end_computation_timer(self):
-        self.t_comp = (time.time() - self.iter_start_time) / self.batch_size
-        # reduce computational time data point (avg) and send to the process of rank 0
-        self.t_comp = communication.reduce(self.t_comp, average=True, all_reduce=False)
+        if self.use_cuda_events:
+            self.comp_end_event.record()
+        else:
+            self.comp_end_time = time.time()
 
     def end_dataloading_timer(self):
         self.t_data = self.iter_start_time - self.iter_end_time
+
+    def reduce_timers(self):
+        """Compute the timings of the current iteration. Done only when they are logged
+        as it waits for the GPU to finish the computation and communicates between processes.
+        """
+        if self.use_cuda_events:
+            # Wait only for the work queued until the end event, not for the whole device
+            self.comp_end_event.synchronize()
+            # Elapsed time between the events is in milliseconds
+            t_comp = self.comp_start_event.elapsed_time(self.comp_end_event) / 1000
+        else:
+            t_comp = self.comp_end_time - self.iter_start_time
+        # reduce computational time data point (avg) and send to the process of rank 0
+        self.t_comp = communication.reduce(t_comp / self.batch_size, average=True, all_reduce=False)
         # reduce data loading per data point (avg) and send to the process of rank 0
         self.t_data = communication.reduce(self.t_data, average=True, all_reduce=False)
 
     def close(self):
-        if communication.get_rank() == 0 and self.tensorboard:
+        if self.is_main_process and self.tensorboard:
             self.tensorboard.close()
 
     def _save_image(self, visuals, name):
-        if communication.get_rank() == 0:
+        if self.is_main_process:
             image_name, image = visuals['name'], visuals['image']
             file_path = Path(self.output_dir) / f"images/{name}_{image_name}.png"
             io.mkdirs(file_path.parent)
@@ -35,6 +35,7 @@ class InferenceTracker(BaseTracker):
                        f" | inference: {self.t_comp:.2f}s | saving: {self.t_save:.2f}s")
             self.logger.info(message)
 
+        self.reduce_timers()
         visuals = parse_visuals(visuals)
         log_message()
 
@@ -62,6 +62,7 @@ class TrainingTracker(BaseTracker):
         def log_visuals():
             self._save_image(visuals, self.iter_idx)
 
+        self.reduce_timers()
         visuals = parse_visuals(visuals)
         losses = parse_losses(losses)
         metrics = parse_metrics(metrics)
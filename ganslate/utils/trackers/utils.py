@@ -1,5 +1,4 @@
 import torch
-import wandb
 from ganslate.utils import communication
 
 
@@ -104,6 +103,8 @@ def process_visuals_wandb_tensorboard(visuals, image_window=None, is_wandb=False
         image = (image - image_window[0]) / image_window[1] - image_window[0]
 
     if is_wandb:
+        # Imported here to not load wandb in runs that do not log to it
+        import wandb
         return wandb.Image(image.cpu().detach().numpy(), caption=name)
     return {"name": name, "image": image}
 
@@ -3,11 +3,13 @@ import random
 import numpy as np
 import torch
 from torch.utils.data import Dataset
+from torch.utils.data.dataloader import default_collate
 import SimpleITK as sitk
 from ganslate.utils.io import make_dataset_of_files
 from ganslate.utils import sitk_utils
 from ganslate.data.utils.normalization import z_score_normalize
 from ganslate.data.utils.stochastic_focal_patching import StochasticFocalPatchSampler
+from projects.brats_mri_sequence_translation.pack_dataset import load_index, open_volumes
 
 # Config imports
 from typing import Tuple
@@ -23,6 +25,15 @@ class BratsDatasetConfig(configs.base.BaseDatasetConfig):
     focal_region_proportion: float = 0
     source_sequence: str = "flair"
     target_sequence: str = "t1w"
+    # Keep the loaded sequences in memory instead of reading them from disk on every access.
+    # Each dataloader worker holds its own cache, size the number of workers accordingly.
+    cache_volumes: bool = False
+    # The `root` is a directory with the volumes packed into a single file by `pack_dataset.py`,
+    # which is memory-mapped instead of loading a .nii.gz file on every access
+    packed: bool = False
+    # Number of patch pairs sampled from each loaded pair of volumes, amortizing the loading.
+    # The patches are flattened into the batch, making its size `batch_size * patches_per_volume`.
+    patches_per_volume: int = 1
 
 
 EXTENSIONS = ['.nii.gz']
@@ -48,7 +59,15 @@ class BratsDataset(Dataset):
 
     def __init__(self, conf):
         dir_brats = conf.train.dataset.root
-        self.paths_brats = make_dataset_of_files(dir_brats, EXTENSIONS)
+        self.packed = conf.train.dataset.packed
+        if self.packed:
+            self.packed_dir = dir_brats
+            self.packed_index = load_index(dir_brats)
+            # Opened on first access so that each dataloader worker maps the file itself
+            self.packed_volumes = None
+            self.paths_brats = [volume["name"] for volume in self.packed_index["volumes"]]
+        else:
+            self.paths_brats = make_dataset_of_files(dir_brats, EXTENSIONS)
         self.num_datapoints = len(self.paths_brats)
 
         focal_region_proportion = conf.train.dataset.focal_region_proportion
@@ -58,42 +77,81 @@ class BratsDataset(Dataset):
         self.source_sequence = conf.train.dataset.source_sequence
         self.target_sequence = conf.train.dataset.target_sequence
 
+        self.cache_volumes = conf.train.dataset.cache_volumes
+        self.cache = {}
+
+        self.patches_per_volume = conf.train.dataset.patches_per_volume
+
     def __getitem__(self, index):
         index_A = index % self.num_datapoints
         index_B = random.randint(0, self.num_datapoints - 1)
 
-        path_A = self.paths_brats[index_A]
-        path_B = self.paths_brats[index_B]
-
-        # load nrrd as SimpleITK objects
-        A = sitk_utils.load(path_A)
-        B = sitk_utils.load(path_B)
-
-        A = get_mri_sequence(A, self.source_sequence)
-        B = get_mri_sequence(B, self.target_sequence)
-
-        if (sitk_utils.is_image_smaller_than(A, self.patch_size) or
-                sitk_utils.is_image_smaller_than(B, self.patch_size)):
+        if self.packed:
+            A = self.load_packed_sequence(index_A, self.source_sequence)
+            B = self.load_packed_sequence(index_B, self.target_sequence)
+        else:
+            A = self.load_sequence(self.paths_brats[index_A], self.source_sequence)
+            B = self.load_sequence(self.paths_brats[index_B], self.target_sequence)
+
+        # When the patch size is 2D, the volume size is checked in xy only
+        patch_dims = len(self.patch_size)
+        if ((np.array(A.shape[-patch_dims:]) < self.patch_size).any() or
+                (np.array(B.shape[-patch_dims:]) < self.patch_size).any()):
             raise ValueError("Volume size not smaller than the defined patch size.\
                               \nA: {} \nB: {} \npatch_size: {}."\
-                             .format(sitk_utils.get_torch_like_size(A),
-                                     sitk_utils.get_torch_like_size(B),
-                                     self.patch_size))
+                             .format(A.shape, B.shape, self.patch_size))
+
+        # Preallocated patches with a channel dimension (1 = grayscale)
+        patches_shape = (self.patches_per_volume, 1, *self.patch_size.tolist())
+        A_patches, B_patches = torch.empty(patches_shape), torch.empty(patches_shape)
+        for i in range(self.patches_per_volume):
+            A_patches[i, 0], B_patches[i, 0] = self.get_normalized_patch_pair(A, B)
 
-        A = sitk_utils.get_tensor(A)
-        B = sitk_utils.get_tensor(B)
+        if self.patches_per_volume == 1:
+            return {'A': A_patches[0], 'B': B_patches[0]}
+        return {'A': A_patches, 'B': B_patches}
 
-        # Extract patches
+    def get_normalized_patch_pair(self, A, B):
+        # Extract patches from the arrays, only the patches are then converted to tensors.
+        # Volumes packed as int16 are converted to float only here, on the patch.
         A, B = self.patch_sampler.get_patch_pair(A, B)
+        A = torch.from_numpy(np.ascontiguousarray(A)).float()
+        B = torch.from_numpy(np.ascontiguousarray(B)).float()
         # Z-score normalization per volume
         A = z_score_normalize(A, scale_to_range=(-1, 1))
         B = z_score_normalize(B, scale_to_range=(-1, 1))
-
-        # Add channel dimension (1 = grayscale)
-        A = A.unsqueeze(0)
-        B = B.unsqueeze(0)
-
-        return {'A': A, 'B': B}
+        return A, B
+
+    def collate_fn(self, batch):
+        """Flattens the patches of each pair of volumes into the batch dimension."""
+        batch = default_collate(batch)
+        if self.patches_per_volume > 1:
+            batch = {k: v.flatten(0, 1) for k, v in batch.items()}
+        return batch
+
+    def load_sequence(self, path, sequence_name):
+        """Load an MRI sequence of a BraTS volume as a numpy array, from the cache if enabled."""
+        key = (path, sequence_name)
+        if key in self.cache:
+            return self.cache[key]
+
+        # load nrrd as SimpleITK object and extract the sequence
+        sitk_image = sitk_utils.load(path)
+        sequence = sitk_utils.get_npy(get_mri_sequence(sitk_image, sequence_name))
+
+        if self.cache_volumes:
+            self.cache[key] = sequence
+        return sequence
+
+    def load_packed_sequence(self, index, sequence_name):
+        """Return an MRI sequence of a packed BraTS volume as a view of the memory-mapped file."""
+        if self.packed_volumes is None:
+            self.packed_volumes = open_volumes(self.packed_dir, self.packed_index["dtype"])
+
+        entry = self.packed_index["volumes"][index]
+        offset, shape = entry["offset"], entry["shape"]
+        volume = self.packed_volumes[offset:offset + np.prod(shape)].reshape(shape)
+        return volume[SEQUENCE_MAP[sequence_name.lower()]]
 
     def __len__(self):
         return self.num_datapoints
@@ -0,0 +1,67 @@
+# Packs the BraTS volumes of a directory into a single binary file and a JSON index,
+# allowing the dataset to memory-map all of the volumes at once instead of decompressing
+# a .nii.gz file per sample. Use the output directory as the dataset `root` with `packed: True`.
+# BraTS intensities are integers, storing them as int16 (`--dtype int16`) halves the size of the file.
+import json
+from pathlib import Path
+
+import numpy as np
+from loguru import logger
+
+from ganslate.utils import sitk_utils
+from ganslate.utils.io import make_dataset_of_files
+
+EXTENSIONS = ['.nii.gz']
+VOLUMES_FILENAME = "volumes.bin"
+INDEX_FILENAME = "index.json"
+
+
+def pack(source_dir, output_dir, dtype="float32"):
+    source_paths = make_dataset_of_files(source_dir, EXTENSIONS)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    index = {"dtype": dtype, "volumes": []}
+    offset = 0
+    with open(output_dir / VOLUMES_FILENAME, "wb") as volumes_file:
+        for path in source_paths:
+            # All four MRI sequences of a volume are stored, the dataset selects one of them
+            volume = sitk_utils.get_npy(sitk_utils.load(path))
+            packed_volume = volume.astype(dtype)
+            if not np.array_equal(packed_volume, volume):
+                raise ValueError(f"Values of `{path}` cannot be stored as {dtype} without a loss.")
+            volume = packed_volume
+
+            volumes_file.write(np.ascontiguousarray(volume).tobytes())
+            index["volumes"].append({"name": path.name, "offset": offset, "shape": volume.shape})
+            # Offset in number of elements
+            offset += volume.size
+            logger.info(f"Packed {path.name} with shape {volume.shape}.")
+
+    with open(output_dir / INDEX_FILENAME, "w") as index_file:
+        json.dump(index, index_file, indent=4)
+    logger.info(f"Packed {len(source_paths)} volumes into `{output_dir}`.")
+
+
+def load_index(packed_dir):
+    with open(Path(packed_dir) / INDEX_FILENAME) as index_file:
+        return json.load(index_file)
+
+
+def open_volumes(packed_dir, dtype):
+    """Memory-map the packed volumes, only the parts that are accessed are read from the disk."""
+    return np.memmap(Path(packed_dir) / VOLUMES_FILENAME, dtype=dtype, mode="r")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument("source_dir")
+    parser.add_argument("output_dir")
+    parser.add_argument("--dtype", default="float32", choices=["float32", "int16"])
+
+    args = parser.parse_args()
+
+    pack(args.source_dir, args.output_dir, args.dtype)
@@ -16,7 +16,7 @@ from ganslate.utils.io import make_dataset_of_files
 from dataclasses import dataclass
 from ganslate import configs
 
-from ganslate.data.utils.normalization import min_max_normalize
+from ganslate.data.utils.normalization import clip_and_min_max_normalize
 
 
 EXTENSIONS = ['.jpg', '.exr']
@@ -79,7 +79,6 @@ class ClearGraspTrainDataset(Dataset):
 
         index_A = index % self.dataset_size
         index_B = index_A if self.paired else random.randint(0, self.dataset_size - 1)
-        index_A, index_B = 9, 1  ##
         
         image_path_A, image_path_B = {}, {}
         image_path_A['RGB'] = self.image_paths['RGB'][index_A]
@@ -183,10 +182,5 @@ def read_depthmap_to_tensor(path):
     """
     depthmap = cv2.imread(str(path), cv2.IMREAD_ANYDEPTH)
     depthmap = np.expand_dims(depthmap, axis=0)  # (H,W) to (1,H,W)
-    return torch.tensor(depthmap, dtype=torch.float32)
-
-
-def clip_and_min_max_normalize(tensor, min_value, max_value):
-    tensor = torch.clamp(tensor, min_value, max_value)
-    tensor = min_max_normalize(tensor, min_value, max_value)
-    return tensor
+    # EXR depthmaps are already float32, sharing the array's memory avoids a copy
+    return torch.from_numpy(depthmap).float()
@@ -17,7 +17,7 @@ from ganslate.utils.io import make_dataset_of_files
 from dataclasses import dataclass
 from ganslate import configs
 
-from ganslate.data.utils.normalization import min_max_normalize, min_max_denormalize
+from ganslate.data.utils.normalization import clip_and_min_max_normalize, min_max_denormalize
 
 
 EXTENSIONS = ['.jpg', '.exr']
@@ -157,8 +157,9 @@ class ClearGraspValTestDataset(Dataset):
         else:
             tensor = tensor.squeeze()  # (1,H,W) -> (H,W)
 
-        # Rescale back to [self.depthmap_min, self.depthmap_max]
-        tensor = min_max_denormalize(tensor.cpu(), self.depthmap_min, self.depthmap_max)
+        # Rescale back to [self.depthmap_min, self.depthmap_max], on the tensor's device
+        # and on a copy as the tensor is still used for metrics. Moved to CPU only once done.
+        tensor = min_max_denormalize(tensor.clone(), self.depthmap_min, self.depthmap_max).cpu()
 
         # Write to file
         os.makedirs(save_dir, exist_ok=True)
@@ -195,15 +196,10 @@ def read_depthmap_to_tensor(path):
     """
     depthmap = cv2.imread(str(path), cv2.IMREAD_ANYDEPTH)
     depthmap = np.expand_dims(depthmap, axis=0)  # (H,W) to (1,H,W)
-    return torch.tensor(depthmap, dtype=torch.float32)
+    # EXR depthmaps are already float32, sharing the array's memory avoids a copy
+    return torch.from_numpy(depthmap).float()
 
 
 def write_depthmap_tensor_to_exr(depthmap, path):
     depthmap = depthmap.numpy()
     cv2.imwrite(path, depthmap, [cv2.IMWRITE_EXR_TYPE, cv2.IMWRITE_EXR_TYPE_FLOAT])
-
-
-def clip_and_min_max_normalize(tensor, min_value, max_value):
-    tensor = torch.clamp(tensor, min_value, max_value)
-    tensor = min_max_normalize(tensor, min_value, max_value)
-    return tensor
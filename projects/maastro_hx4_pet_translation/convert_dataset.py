@@ -0,0 +1,57 @@
+# Re-encodes the NRRD images of the HX4 dataset to the smallest data type that stores them without
+# a loss, e.g. int16 for the CTs (HU) and uint8 for the body masks, halving (or more) the bytes read
+# per sample. The images are cast to float only after the patch is extracted, so the dataset needs no
+# changes. PETs (SUVs) are floats and are only downcast to float32 if that is lossless.
+# Images are written uncompressed by default so that only the patch region is read from the disk.
+# The `SUVmean_aorta_HX4.csv` file, expected next to the dataset root, is not copied.
+from pathlib import Path
+
+import numpy as np
+import SimpleITK as sitk
+from loguru import logger
+
+from ganslate.utils import sitk_utils
+
+CANDIDATE_DTYPES = ['uint8', 'int16', 'float32']
+
+
+def get_compact_array(array):
+    """Returns the array cast to the first candidate dtype that represents it exactly."""
+    for dtype in CANDIDATE_DTYPES:
+        if np.dtype(dtype).itemsize >= array.dtype.itemsize:
+            break
+        compact_array = array.astype(dtype)
+        if np.array_equal(compact_array, array):
+            return compact_array
+    return array
+
+
+def convert(source_root, output_root, use_compression=False):
+    source_root, output_root = Path(source_root), Path(output_root)
+
+    for source_path in sorted(source_root.glob("*/*.nrrd")):
+        sitk_image = sitk_utils.load(source_path)
+        array = sitk_utils.get_npy(sitk_image)
+        compact_array = get_compact_array(array)
+
+        compact_image = sitk.GetImageFromArray(compact_array)
+        compact_image.CopyInformation(sitk_image)
+
+        output_path = output_root / source_path.relative_to(source_root)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        sitk.WriteImage(compact_image, str(output_path), use_compression)
+        logger.info(f"{source_path.relative_to(source_root)}: {array.dtype} -> {compact_array.dtype}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument("source_root")
+    parser.add_argument("output_root")
+    parser.add_argument("--compress", action="store_true")
+
+    args = parser.parse_args()
+
+    convert(args.source_root, args.output_root, args.compress)
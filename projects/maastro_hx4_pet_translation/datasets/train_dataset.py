@@ -16,13 +16,14 @@ from torch.utils.data import Dataset
 
 from ganslate import configs
 from ganslate.utils import sitk_utils
+from ganslate.data.utils.normalization import clip_and_min_max_normalize
 
 
 import projects.maastro_hx4_pet_translation.datasets.utils.patch_samplers as patch_samplers
 from projects.maastro_hx4_pet_translation.datasets.utils.basic import (sitk2np, 
                                                                        np2tensor, 
-                                                                       apply_body_mask,
-                                                                       clip_and_min_max_normalize)
+                                                                       load_patch,
+                                                                       apply_body_mask)
 
 
 
@@ -83,6 +84,8 @@ class HX4PETTranslationTrainDataset(Dataset):
         suv_aorta_mean_file =  f"{os.path.dirname(root_path)}/SUVmean_aorta_HX4.csv"
         self.suv_aorta_mean_values = pd.read_csv(suv_aorta_mean_file, index_col=0)
         self.suv_aorta_mean_values = self.suv_aorta_mean_values.to_dict()['HX4 aorta SUVmean baseline']
+        # Aligned with the image paths, indexed by the same integer index
+        self.suv_aorta_mean_values = [self.suv_aorta_mean_values[p_id] for p_id in self.patient_ids]
 
         # Clipping ranges
         self.hu_min, self.hu_max = conf.train.dataset.hu_range
@@ -92,6 +95,10 @@ class HX4PETTranslationTrainDataset(Dataset):
         # Patch sampler setup
         patch_size = np.array(conf.train.dataset.patch_size)
         patch_sampling = conf.train.dataset.patch_sampling
+        # Images needed in full to sample the location of patches, the rest is read only within the patch
+        self.sampling_image_keys = ['body-mask']
+        if patch_sampling.startswith('fdg-pet-weighted'):
+            self.sampling_image_keys.append('FDG-PET')
         if self.paired:
             self.patch_sampler = patch_samplers.PairedPatchSampler3D(patch_size, patch_sampling)
         else:
@@ -122,13 +129,40 @@ class HX4PETTranslationTrainDataset(Dataset):
         image_path_A['body-mask'] = self.image_paths['body-mask-A'][index_A]
         image_path_B['body-mask'] = self.image_paths['body-mask-B'][index_B]
 
-        # Load NRRD as SimpleITK objects (WHD)
+        # Load NRRD as SimpleITK objects (WHD), only the images needed for sampling the patches
+        sampling_images_A, sampling_images_B = {}, {}
+        for k in self.sampling_image_keys:
+            sampling_images_A[k] = sitk_utils.load(image_path_A[k])
+        # If paired, B uses the same body mask file as A, so it is not read a second time
+        if not self.paired:
+            sampling_images_B['body-mask'] = sitk_utils.load(image_path_B['body-mask'])
+
+        # Convert to numpy (DHW)
+        sampling_images_A = sitk2np(sampling_images_A)
+        sampling_images_B = sitk2np(sampling_images_B)
+        if self.paired:
+            # Only read from, never modified, so the array can be shared
+            sampling_images_B['body-mask'] = sampling_images_A['body-mask']
+
+
+        # --------------
+        # Sample patches
+
+        slices_A, slices_B = self.patch_sampler.get_patch_slices(sampling_images_A, sampling_images_B)
+
+        # Get patches, reading only the patch region of the images not loaded for sampling
         images_A, images_B = {}, {}
         for k in image_path_A.keys():
-            images_A[k] = sitk_utils.load(image_path_A[k])
+            if k in sampling_images_A:
+                images_A[k] = sampling_images_A[k][slices_A]
+            else:
+                images_A[k] = load_patch(image_path_A[k], slices_A)
         for k in image_path_B.keys():
-            images_B[k] = sitk_utils.load(image_path_B[k])
-        
+            if k in sampling_images_B:
+                images_B[k] = sampling_images_B[k][slices_B]
+            else:
+                images_B[k] = load_patch(image_path_B[k], slices_B)
+
 
         # ---------
         # Transform
@@ -137,20 +171,10 @@ class HX4PETTranslationTrainDataset(Dataset):
 
         # ---------------
         # Apply body mask
-        
-        # Convert to numpy (DHW)
-        images_A = sitk2np(images_A)
-        images_B = sitk2np(images_B)
 
         images_A = apply_body_mask(images_A)
         images_B = apply_body_mask(images_B)
-        
 
-        # --------------
-        # Sample patches
-
-        # Get patches
-        images_A, images_B = self.patch_sampler.get_patch_pair(images_A, images_B)
 
         # Convert to tensors 
         images_A = np2tensor(images_A)
@@ -160,14 +184,15 @@ class HX4PETTranslationTrainDataset(Dataset):
         # -------------
         # Normalization
 
-        # Normalize HX4-PET SUVs with SUVmean_aorta
-        patient_id = self.patient_ids[index_B]
-        images_B['HX4-PET'] = images_B['HX4-PET'] / self.suv_aorta_mean_values[patient_id]
-
         # Clip and then rescale all intensties to range [-1, 1]
         images_A['FDG-PET'] = clip_and_min_max_normalize(images_A['FDG-PET'], self.fdg_suv_min, self.fdg_suv_max)
         images_A['pCT'] = clip_and_min_max_normalize(images_A['pCT'], self.hu_min, self.hu_max)
-        images_B['HX4-PET'] = clip_and_min_max_normalize(images_B['HX4-PET'], self.hx4_tbr_min, self.hx4_tbr_max)
+        # HX4-PET SUVs are normalized to TBR with SUVmean_aorta. Equivalent to dividing the image by it,
+        # but scaling the TBR range instead saves a pass over the image and its allocation
+        suv_aorta_mean = self.suv_aorta_mean_values[index_B]
+        images_B['HX4-PET'] = clip_and_min_max_normalize(images_B['HX4-PET'], 
+                                                         self.hx4_tbr_min * suv_aorta_mean, 
+                                                         self.hx4_tbr_max * suv_aorta_mean)
         if self.require_ldct_for_training:
             images_B['ldCT'] = clip_and_min_max_normalize(images_B['ldCT'], self.hu_min, self.hu_max)
 
@@ -3,8 +3,7 @@ import torch
 import SimpleITK as sitk
 
 from ganslate.utils import sitk_utils
-from ganslate.data.utils.body_mask import get_body_mask
-from ganslate.data.utils.normalization import min_max_normalize
+from ganslate.data.utils.body_mask import get_body_mask, get_cached_body_mask
 
 
 # Body mask settings
@@ -14,33 +13,35 @@ HU_THRESHOLD = -300
 
 
 
-def apply_body_mask(image_dict, generate_body_mask=False):
+def apply_body_mask(image_dict, generate_body_mask=False, body_mask_cache_dir=None, ct_path=None):
 
     # If body mask doesn't exist, then create one from the available CT using morph. ops
     if generate_body_mask: 
         assert image_dict['body-mask'] is None
         assert any(['CT' in k for k in image_dict.keys()])  # There should be a CT in the dict to be able to generate a mask
         ct_image_name = [k for k in image_dict.keys() if 'CT' in k][0]
-        image_dict['body-mask'] = get_body_mask(image_dict[ct_image_name], HU_THRESHOLD)
+        if body_mask_cache_dir is not None:
+            # Generated once and reused, e.g. in every validation run
+            assert ct_path is not None, "The path of the CT is needed to cache its body mask."
+            image_dict['body-mask'] = get_cached_body_mask(image_dict[ct_image_name], HU_THRESHOLD,
+                                                           body_mask_cache_dir, ct_path)
+        else:
+            image_dict['body-mask'] = get_body_mask(image_dict[ct_image_name], HU_THRESHOLD)
 
     # Apply masking to any CT or PET image present in image_dict
     assert image_dict['body-mask'] is not None
-    body_mask = image_dict['body-mask']
+    # Computed once for all images. Masks are not necessarily boolean, hence no `~`
+    outside_body = np.logical_not(image_dict['body-mask'])
+    # Masked in-place instead of allocating a new array per image
     for k in image_dict.keys():
         if 'PET' in k:
-            image_dict[k] = np.where(body_mask, image_dict[k], OUT_OF_BODY_SUV)
+            image_dict[k][outside_body] = OUT_OF_BODY_SUV
         elif 'CT' in k:
-            image_dict[k] = np.where(body_mask, image_dict[k], OUT_OF_BODY_HU)
+            image_dict[k][outside_body] = OUT_OF_BODY_HU
 
     return image_dict
 
 
-def clip_and_min_max_normalize(tensor, min_value, max_value):
-    tensor = torch.clamp(tensor, min_value, max_value)
-    tensor = min_max_normalize(tensor, min_value, max_value)
-    return tensor
-
-
 def sitk2np(image_dict):
     # WHD to DHW
     for k in image_dict.keys():
@@ -48,7 +49,16 @@ def sitk2np(image_dict):
             image_dict[k] = sitk_utils.get_npy(image_dict[k])
     return image_dict
 
+def load_patch(file_path, patch_slices):
+    """Load only the patch (DHW slices) of an image as a numpy array (DHW)."""
+    # DHW to WHD
+    start = [s.start for s in reversed(patch_slices)]
+    size = [s.stop - s.start for s in reversed(patch_slices)]
+    return sitk_utils.get_npy(sitk_utils.load_region(file_path, start, size))
+
+
 def np2tensor(image_dict):
+    # Shares the memory with the array, a copy is made only if it is not contiguous (e.g. a patch)
     for k in image_dict.keys():
-        image_dict[k] = torch.tensor(image_dict[k])
+        image_dict[k] = torch.from_numpy(np.ascontiguousarray(image_dict[k]))
     return image_dict
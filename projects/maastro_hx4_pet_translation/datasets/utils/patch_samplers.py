@@ -24,26 +24,31 @@ class PairedPatchSampler3D():
 
 
     def get_patch_pair(self, image_dict_A, image_dict_B):
-        
-        # Sample a single focal point to be used for both domain A and B images
-        # Domain A and domain B images are expected to be voxel-to-voxel paired
-        focal_point = self._sample_common_focal_point(image_dict_A)
+        slices_A, slices_B = self.get_patch_slices(image_dict_A, image_dict_B)
 
-        # Extract patches from all volumes given this focal point and the patch size
-        start_idx = focal_point - np.floor(self.patch_size/2)
-        end_idx = start_idx + self.patch_size
-        z1, y1, x1 = start_idx.astype(np.uint16)
-        z2, y2, x2 = end_idx.astype(np.uint16)
-    
+        # Extract patches from all volumes
         patch_dict_A, patch_dict_B = {}, {}
         for k in image_dict_A.keys():
-            patch_dict_A[k] = image_dict_A[k][z1:z2, y1:y2, x1:x2]
+            patch_dict_A[k] = image_dict_A[k][slices_A]
         for k in image_dict_B.keys():
-            patch_dict_B[k] = image_dict_B[k][z1:z2, y1:y2, x1:x2]
+            patch_dict_B[k] = image_dict_B[k][slices_B]
         
         return patch_dict_A, patch_dict_B
 
 
+    def get_patch_slices(self, image_dict_A, image_dict_B):
+        """Sample the location of the patches and return their slices (DHW) for A and B images.
+        Only the body mask, and FDG-PET for 'fdg-pet-weighted' sampling, of A images are used.
+        """
+        # Sample a single focal point to be used for both domain A and B images
+        # Domain A and domain B images are expected to be voxel-to-voxel paired
+        focal_point = self._sample_common_focal_point(image_dict_A)
+
+        # Slices of the patch given this focal point and the patch size
+        patch_slices = get_patch_slices(focal_point, self.patch_size)
+        return patch_slices, patch_slices
+
+
     def _sample_common_focal_point(self, image_dict_A):        
         body_mask = image_dict_A['body-mask']
         volume_size = body_mask.shape[-3:]  # DHW
@@ -98,34 +103,36 @@ class UnpairedPatchSampler3D():
 
 
     def get_patch_pair(self, image_dict_A, image_dict_B):
-        # Sample a focal point and its size-normlaized version for domain A images
-        focal_point_A, relative_focal_point = self._sample_focal_point_A(image_dict_A)
-
-        # Sample a focal point for B images that is in relative neighborhood of the focal point of A images
-        focal_point_B = self._sample_focal_point_B(image_dict_B, relative_focal_point)
+        slices_A, slices_B = self.get_patch_slices(image_dict_A, image_dict_B)
 
-        # Extract patches from all volumes given this focal point and the patch size
-        start_idx_A = focal_point_A - np.floor(self.patch_size/2)
-        end_idx_A = start_idx_A + self.patch_size
-        z1_A, y1_A, x1_A = start_idx_A.astype(np.uint16)
-        z2_A, y2_A, x2_A = end_idx_A.astype(np.uint16)
-
-        start_idx_B = focal_point_B - np.floor(self.patch_size/2)
-        end_idx_B = start_idx_B + self.patch_size
-        z1_B, y1_B, x1_B = start_idx_B.astype(np.uint16)
-        z2_B, y2_B, x2_B = end_idx_B.astype(np.uint16)
-    
+        # Extract patches from all volumes
         patch_dict_A = {}
         for k in image_dict_A.keys():
-            patch_dict_A[k] = image_dict_A[k][z1_A:z2_A, y1_A:y2_A, x1_A:x2_A]
+            patch_dict_A[k] = image_dict_A[k][slices_A]
         
         patch_dict_B = {}
         for k in image_dict_B.keys():
-            patch_dict_B[k] = image_dict_B[k][z1_B:z2_B, y1_B:y2_B, x1_B:x2_B]
+            patch_dict_B[k] = image_dict_B[k][slices_B]
         
         return patch_dict_A, patch_dict_B
 
 
+    def get_patch_slices(self, image_dict_A, image_dict_B):
+        """Sample the location of the patches and return their slices (DHW) for A and B images.
+        Only the body masks, and FDG-PET for 'fdg-pet-weighted-sf' sampling, are used.
+        """
+        # Sample a focal point and its size-normlaized version for domain A images
+        focal_point_A, relative_focal_point = self._sample_focal_point_A(image_dict_A)
+
+        # Sample a focal point for B images that is in relative neighborhood of the focal point of A images
+        focal_point_B = self._sample_focal_point_B(image_dict_B, relative_focal_point)
+
+        # Slices of the patches given the focal points and the patch size
+        slices_A = get_patch_slices(focal_point_A, self.patch_size)
+        slices_B = get_patch_slices(np.array(focal_point_B), self.patch_size)
+        return slices_A, slices_B
+
+
     def _sample_focal_point_A(self, image_dict_A):
         body_mask = image_dict_A['body-mask']
         volume_size = body_mask.shape  # DHW
@@ -205,7 +212,8 @@ class UnpairedPatchSampler3D():
         #   2. AND, Within body region 
         #   3. AND, Within focal region
         intersection_mask = sampling_prob_map * focal_region_mask
-        if 1 not in list(np.unique(intersection_mask)):
+        # Checked without `np.unique` as it sorts all of the voxels
+        if not np.any(intersection_mask == 1):
             # Edge case: If no intersection region is found between (1+2) and (3),
             # just sample a B-image patch from anywhere within (1+2) region, i.e. valid body region
             logger.warning("Stochastic focal sampling failed in a domain B image. \
@@ -232,17 +240,20 @@ def sample_from_probability_map(sampling_prob_map):
     """
     # Check if samplig prob map is a proper distribution (i.e. its sum is approx. equal to 1)
     epsilon = 0.001
-    assert np.sum(sampling_prob_map) > 1 - epsilon and np.sum(sampling_prob_map) < 1 + epsilon 
+    prob_sum = np.sum(sampling_prob_map)
+    assert prob_sum > 1 - epsilon and prob_sum < 1 + epsilon 
 
-    # Select relevant indices to sample from (i.e. those having a non-zero probability)
-    relevant_idxs = np.argwhere(sampling_prob_map > 0)
+    # Select relevant indices to sample from (i.e. those having a non-zero probability).
+    # Flat indices avoid building the (N, 3) array of all relevant voxel coordinates.
+    flat_prob_map = sampling_prob_map.ravel()
+    relevant_flat_idxs = np.flatnonzero(flat_prob_map > 0)
 
     # Using the sampling probability map, define the sampling distribution over these relevant indices
-    distribution = sampling_prob_map[sampling_prob_map > 0].flatten()
+    distribution = flat_prob_map[relevant_flat_idxs]
     
-    # Sample a single voxel index. This is the focal point.
-    s = np.random.choice(len(relevant_idxs), p=distribution)
-    sampled_idx = relevant_idxs[s]
+    # Sample a single voxel index and convert only it to coordinates. This is the focal point.
+    s = np.random.choice(len(relevant_flat_idxs), p=distribution)
+    sampled_idx = np.array(np.unravel_index(relevant_flat_idxs[s], sampling_prob_map.shape))
     
     return sampled_idx
 
@@ -269,6 +280,14 @@ def init_sampling_probability_map(volume_size, patch_size, body_mask=None):
     return sampling_prob_map
 
 
+def get_patch_slices(focal_point, patch_size):
+    """Slices (DHW) of a patch of the given size centered around the focal point."""
+    start_idx = focal_point - np.floor(patch_size/2)
+    end_idx = start_idx + patch_size
+    start_idx, end_idx = start_idx.astype(np.uint16), end_idx.astype(np.uint16)
+    return tuple(slice(int(start), int(end)) for start, end in zip(start_idx, end_idx))
+
+
 def get_valid_region_corner_points(volume_size, patch_size):
     valid_foc_pt_idx_min = np.zeros(3) + np.floor(patch_size/2)
     valid_foc_pt_idx_max = np.array(volume_size) - np.ceil(patch_size/2)   
@@ -1,6 +1,6 @@
 import os
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Optional, Tuple
 from loguru import logger
 
 import pandas as pd
@@ -9,13 +9,12 @@ from torch.utils.data import Dataset
 
 from ganslate import configs
 from ganslate.utils import sitk_utils
-from ganslate.data.utils.normalization import min_max_denormalize
+from ganslate.data.utils.normalization import clip_and_min_max_normalize, min_max_denormalize
 from ganslate.data.utils.ops import pad
 
 from projects.maastro_hx4_pet_translation.datasets.utils.basic import (sitk2np, 
                                                                        np2tensor, 
-                                                                       apply_body_mask,
-                                                                       clip_and_min_max_normalize)
+                                                                       apply_body_mask)
 
 
 @dataclass
@@ -34,6 +33,9 @@ class HX4PETTranslationValTestDatasetConfig(configs.base.BaseDatasetConfig):
     supply_masks: bool = False
     # Is the model HX4CycleGANBalanced? If so, need to do a small hack while supplying HX4-PET 
     model_is_hx4_cyclegan_balanced: bool = False
+    # Directory in which the body masks generated for patients without one are cached, instead of
+    # generating them in every validation run. Not cached if not set.
+    body_mask_cache_dir: Optional[str] = None
 
 
 class HX4PETTranslationValTestDataset(Dataset):
@@ -78,6 +80,9 @@ class HX4PETTranslationValTestDataset(Dataset):
         # Is HX4-CycleGAN-balanced the model being validated/tested ?
         self.model_is_hx4_cyclegan_balanced = conf.val.dataset.model_is_hx4_cyclegan_balanced        
 
+        # Where the body masks are cached when they have to be generated, if at all
+        self.body_mask_cache_dir = conf.val.dataset.body_mask_cache_dir
+
 
     def __len__(self):
         return self.num_datapoints
@@ -133,7 +138,7 @@ class HX4PETTranslationValTestDataset(Dataset):
         else:
             generate_body_mask = False
 
-        images = apply_body_mask(images, generate_body_mask)
+        images = apply_body_mask(images, generate_body_mask, self.body_mask_cache_dir, image_path['pCT'])
         
         
         # --------------------
@@ -151,14 +156,15 @@ class HX4PETTranslationValTestDataset(Dataset):
         # -------------
         # Normalization
 
-        # Normalize HX4-PET SUVs with SUVmean_aorta
-        patient_id = self.patient_ids[index]
-        images['HX4-PET'] = images['HX4-PET'] / self.suv_aorta_mean_values[patient_id]
-
         # Clip and then rescale all intensties to range [-1, 1]
         images['FDG-PET'] = clip_and_min_max_normalize(images['FDG-PET'], self.fdg_suv_min, self.fdg_suv_max)
         images['pCT'] = clip_and_min_max_normalize(images['pCT'], self.hu_min, self.hu_max)
-        images['HX4-PET'] = clip_and_min_max_normalize(images['HX4-PET'], self.hx4_tbr_min, self.hx4_tbr_max)
+        # HX4-PET SUVs are normalized to TBR with SUVmean_aorta. Equivalent to dividing the image by it,
+        # but scaling the TBR range instead saves a pass over the image and its allocation
+        suv_aorta_mean = self.suv_aorta_mean_values[self.patient_ids[index]]
+        images['HX4-PET'] = clip_and_min_max_normalize(images['HX4-PET'], 
+                                                       self.hx4_tbr_min * suv_aorta_mean, 
+                                                       self.hx4_tbr_max * suv_aorta_mean)
 
 
         # ---------------------
@@ -207,12 +213,14 @@ class HX4PETTranslationValTestDataset(Dataset):
         else:
             tensor = tensor.squeeze()
 
-        # Rescale back to [self.hx4_tbr_min, self.hx4_tbr_max]
-        tensor = min_max_denormalize(tensor.cpu(), self.hx4_tbr_min, self.hx4_tbr_max)
-        
-        # Denormalize TBR to SUV
+        # Rescale back to [self.hx4_tbr_min, self.hx4_tbr_max] and denormalize TBR to SUV
+        # in a single step by rescaling to the TBR range multiplied with SUVmean_aorta.
+        # Done on the tensor's device, on a copy as the tensor is still used for metrics.
         patient_id = metadata['patient_id']
-        tensor = tensor * self.suv_aorta_mean_values[patient_id]
+        suv_aorta_mean = self.suv_aorta_mean_values[patient_id]
+        tensor = min_max_denormalize(tensor.clone(),
+                                     self.hx4_tbr_min * suv_aorta_mean,
+                                     self.hx4_tbr_max * suv_aorta_mean)
 
         sitk_image = sitk_utils.tensor_to_sitk_image(tensor, metadata['origin'],
                                                      metadata['spacing'], metadata['direction'],
@@ -0,0 +1,92 @@
+import cv2
+import numpy as np
+import pytest
+from scipy import ndimage
+
+from ganslate.data.utils.body_mask import (get_body_mask, get_cached_body_mask,
+                                           smooth_contour_points)
+
+HU_THRESHOLD = -300
+
+
+def make_ct(shape=(6, 64, 64), body_center=(34, 24)):
+    """Synthetic CT of air with an elliptical body in the middle slices
+    and a smaller, separate object (e.g. the couch) below it."""
+    ct = np.full(shape, -1000, dtype=np.int16)
+    y, x = np.ogrid[:shape[1], :shape[2]]
+    body = ((y - body_center[0]) / 14)**2 + ((x - body_center[1]) / 10)**2 <= 1
+    ct[1:5, body] = 40
+    ct[1:5, 56:60, 30:50] = 200
+    return ct
+
+
+def get_full_frame_body_mask(image, hu_threshold):
+    """Reference that searches for the contours in every full slice, as done before
+    the search was limited to the bounding box of the body."""
+    connected_components, _ = ndimage.label(np.uint8(image >= hu_threshold))
+    label_counts = np.bincount(connected_components.ravel())[1:]
+    binarized_image = connected_components == np.argmax(label_counts) + 1
+
+    body_mask = np.zeros(image.shape)
+    for z in range(binarized_image.shape[0]):
+        contours, _ = cv2.findContours(np.uint8(binarized_image[z]), cv2.RETR_TREE,
+                                       cv2.CHAIN_APPROX_SIMPLE)
+        if not contours:
+            continue
+        largest_contour = max(contours, key=cv2.contourArea)
+        cv2.drawContours(body_mask[z], [smooth_contour_points(largest_contour)], -1, 1, -1)
+    return body_mask
+
+
+# Off-centre body, and a body touching the border of the image
+@pytest.mark.parametrize("body_center", [(34, 24), (34, 5)])
+def test_body_mask_same_as_full_frame(body_center):
+    ct = make_ct(body_center=body_center)
+    body_mask = get_body_mask(ct, HU_THRESHOLD)
+    assert body_mask.any()
+    # Only the body is masked, not the smaller object
+    assert not body_mask[:, 56:60, 30:50].any()
+    assert np.array_equal(body_mask, get_full_frame_body_mask(ct, HU_THRESHOLD))
+
+
+def save_source(tmp_path, ct):
+    source_path = tmp_path / "patient" / "ct.npy"
+    source_path.parent.mkdir()
+    np.save(source_path, ct)
+    return source_path
+
+
+def test_cached_body_mask(tmp_path):
+    ct = make_ct()
+    source_path = save_source(tmp_path, ct)
+    cache_dir = tmp_path / "cache"
+
+    mask = get_cached_body_mask(ct, HU_THRESHOLD, cache_dir, source_path)
+    assert np.array_equal(mask, get_body_mask(ct, HU_THRESHOLD))
+    cached_files = list(cache_dir.iterdir())
+    assert len(cached_files) == 1
+    assert f"hu{HU_THRESHOLD}" in cached_files[0].name
+
+    # Loaded from the cache the second time
+    assert np.array_equal(get_cached_body_mask(ct, HU_THRESHOLD, cache_dir, source_path), mask)
+    assert len(list(cache_dir.iterdir())) == 1
+
+    # The mask cached for another threshold is not reused
+    get_cached_body_mask(ct, -500, cache_dir, source_path)
+    assert len(list(cache_dir.iterdir())) == 2
+
+
+def test_cached_body_mask_cleans_up_on_failure(tmp_path, monkeypatch):
+    ct = make_ct()
+    source_path = save_source(tmp_path, ct)
+    cache_dir = tmp_path / "cache"
+
+    def failing_save(file, array):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(np, "save", failing_save)
+    mask = get_cached_body_mask(ct, HU_THRESHOLD, cache_dir, source_path)
+
+    # The mask is still returned, but neither the cache nor the temporary file is left
+    assert np.array_equal(mask, get_body_mask(ct, HU_THRESHOLD))
+    assert list(cache_dir.iterdir()) == []
@@ -0,0 +1,47 @@
+import torch
+
+from ganslate.nn.generators import SelfAttentionVnet3D
+from ganslate.nn.losses.utils.ssim import SSIMLoss
+
+
+def get_generator():
+    torch.manual_seed(0)
+    # Attention blocks on every level, the invertible layers disabled to keep it small
+    return SelfAttentionVnet3D(in_channels=1,
+                               out_channels=1,
+                               norm_type="instance",
+                               first_layer_channels=8,
+                               down_blocks=(1, 1, 1, 1),
+                               up_blocks=(1, 1, 1, 1),
+                               use_memory_saving=False,
+                               use_inverse=False,
+                               enable_attention_block=(True, True, True, True))
+
+
+def forward_backward(generator, x):
+    out = generator(x)
+    out.mean().backward()
+    grads = {name: param.grad.clone() for name, param in generator.named_parameters()}
+    return out, grads
+
+
+def test_generator_forward_backward_channels_last():
+    x = torch.rand(2, 1, 16, 16, 16)
+    expected_out, expected_grads = forward_backward(get_generator(), x)
+
+    # Converted the same way as in `BaseGAN.convert_to_channels_last` and `input_to_device`
+    generator = get_generator().to(memory_format=torch.channels_last_3d)
+    out, grads = forward_backward(generator, x.to(memory_format=torch.channels_last_3d))
+
+    assert torch.allclose(out, expected_out, atol=1e-5)
+    for name, grad in grads.items():
+        assert torch.allclose(grad, expected_grads[name], atol=1e-5), name
+
+
+def test_ssim_channels_last():
+    torch.manual_seed(0)
+    X, Y = torch.rand(2, 1, 16, 16, 16), torch.rand(2, 1, 16, 16, 16)
+    expected = SSIMLoss()(X, Y)
+    ssim = SSIMLoss()(X.to(memory_format=torch.channels_last_3d),
+                      Y.to(memory_format=torch.channels_last_3d))
+    assert torch.allclose(ssim, expected)
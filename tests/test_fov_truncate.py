@@ -0,0 +1,35 @@
+import numpy as np
+import SimpleITK as sitk
+
+from ganslate.data.utils.fov_truncate import truncate_CBCT_based_on_fov
+
+
+def make_cbct(full_fov_slices, num_slices=8, size=10):
+    """Synthetic CBCT (ZYX) where only the given slices have a full FOV, the rest is
+    entirely out of the FOV (-1024). Full FOV slices are filled with their index."""
+    array = np.full((num_slices, size, size), -1024, dtype=np.int16)
+    for idx in full_fov_slices:
+        array[idx] = idx
+    return sitk.GetImageFromArray(array)
+
+
+def get_slice_indices(image):
+    array = sitk.GetArrayFromImage(image)
+    return [int(slice[0, 0]) for slice in array]
+
+
+def test_truncate_starts_at_first_full_fov_slice():
+    image = truncate_CBCT_based_on_fov(make_cbct(full_fov_slices=[2, 3, 4, 5]))
+    # Ends one slice before the last full FOV slice, as the end index is exclusive
+    assert get_slice_indices(image) == [2, 3, 4]
+
+
+def test_truncate_keeps_first_slice_with_full_fov():
+    # The first slice is kept when it already has a full FOV, it used to be dropped
+    image = truncate_CBCT_based_on_fov(make_cbct(full_fov_slices=[0, 1, 2, 3]))
+    assert get_slice_indices(image) == [0, 1, 2]
+
+
+def test_truncate_without_small_fov_at_the_end():
+    image = truncate_CBCT_based_on_fov(make_cbct(full_fov_slices=[3, 4, 5, 6, 7]))
+    assert get_slice_indices(image) == [3, 4, 5, 6, 7]
@@ -0,0 +1,79 @@
+import pytest
+import torch
+
+from ganslate.data.utils.image_pool import ImagePool
+
+
+def make_images(values):
+    """Batch of (1, 2, 2) images, each filled with its value so that it can be identified."""
+    return torch.tensor(values, dtype=torch.float).view(-1, 1, 1, 1).repeat(1, 1, 2, 2)
+
+
+def image_values(images):
+    return images[:, 0, 0, 0].tolist()
+
+
+def test_pool_size_zero_passes_through():
+    pool = ImagePool(0)
+    images = make_images([1, 2])
+    assert pool.query(images) is images
+
+
+def test_fill_phase_returns_and_stores_the_images():
+    pool = ImagePool(4)
+    returned = pool.query(make_images([1, 2, 3]))
+    assert image_values(returned) == [1, 2, 3]
+    assert pool.num_imgs == 3
+    assert image_values(pool.images[:3]) == [1, 2, 3]
+
+
+def test_batch_larger_than_remaining_capacity():
+    torch.manual_seed(0)
+    pool = ImagePool(4)
+    pool.query(make_images([1, 2, 3]))
+
+    returned = pool.query(make_images([4, 5, 6]))
+    assert len(returned) == 3
+    assert pool.num_imgs == 4
+    # The first image fills the pool and is returned as is
+    assert image_values(returned)[0] == 4
+    # The rest are either returned or swapped with a stored image
+    for value in image_values(returned)[1:]:
+        assert value in [1, 2, 3, 4, 5, 6]
+    # No image is lost or duplicated by the swaps
+    all_values = image_values(pool.images) + image_values(returned)[1:]
+    assert sorted(all_values) == [1, 2, 3, 4, 5, 6]
+
+
+def test_swaps_half_of_the_images_when_full():
+    torch.manual_seed(0)
+    pool = ImagePool(4)
+    pool.query(make_images([0, 1, 2, 3]))
+
+    num_queries = 1000
+    num_swapped = 0
+    for value in range(100, 100 + num_queries):
+        returned_value = image_values(pool.query(make_images([value])))[0]
+        stored_values = image_values(pool.images)
+        if returned_value == value:
+            assert value not in stored_values
+        else:
+            # The returned image was taken out of the pool and the queried one put in its place
+            num_swapped += 1
+            assert value in stored_values
+            assert returned_value not in stored_values
+    assert 0.4 < num_swapped / num_queries < 0.6
+
+
+def test_query_fails_on_different_shape():
+    pool = ImagePool(4)
+    pool.query(make_images([1, 2]))
+    with pytest.raises(ValueError):
+        pool.query(torch.zeros(2, 1, 3, 3))
+
+
+def test_query_fails_on_different_dtype():
+    pool = ImagePool(4)
+    pool.query(make_images([1, 2]))
+    with pytest.raises(ValueError):
+        pool.query(make_images([3, 4]).double())
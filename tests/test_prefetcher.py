@@ -0,0 +1,70 @@
+import pytest
+import torch
+from torch.utils.data import DataLoader, Dataset
+
+from ganslate.data.prefetcher import CUDAPrefetcher
+
+pytestmark = pytest.mark.skipif(not torch.cuda.is_available(),
+                                reason="CUDAPrefetcher requires a CUDA device")
+
+DEVICE = torch.device("cuda:0")
+
+
+class DummyDataset(Dataset):
+    """Batches similar to the val/test ones, with metadata next to the images."""
+
+    def __len__(self):
+        return 5
+
+    def __getitem__(self, index):
+        return {
+            "A": torch.full((1, 4, 4), float(index)),
+            "B": torch.full((1, 4, 4), -float(index)),
+            "masks": {"BODY": torch.ones((1, 4, 4))},
+            "metadata": {"patient_id": f"patient_{index}", "spacing": [1.0, 1.0, 2.5]}
+        }
+
+
+def get_data_loader():
+    return DataLoader(DummyDataset(), batch_size=2, shuffle=False)
+
+
+# Without keys, all the tensors are moved. With keys, the masks and metadata stay on CPU.
+@pytest.mark.parametrize("keys", [None, ("A", "B")])
+def test_yields_same_batches(keys):
+    data_loader = get_data_loader()
+    expected_batches = list(data_loader)
+    prefetched_batches = list(CUDAPrefetcher(data_loader, DEVICE, keys=keys))
+
+    assert len(prefetched_batches) == len(expected_batches)
+    for prefetched, expected in zip(prefetched_batches, expected_batches):
+        for key in ("A", "B"):
+            assert prefetched[key].device.type == "cuda"
+            assert torch.equal(prefetched[key].cpu(), expected[key])
+        mask = prefetched["masks"]["BODY"]
+        assert mask.device.type == ("cuda" if keys is None else "cpu")
+        assert torch.equal(mask.cpu(), expected["masks"]["BODY"])
+        # Non-tensor entries are passed through unchanged
+        assert prefetched["metadata"]["patient_id"] == expected["metadata"]["patient_id"]
+
+
+def test_len_and_dataset_pass_through():
+    data_loader = get_data_loader()
+    prefetcher = CUDAPrefetcher(data_loader, DEVICE)
+    assert len(prefetcher) == len(data_loader)
+    assert prefetcher.dataset is data_loader.dataset
+
+
+def test_keys_leave_other_entries_on_cpu():
+    data_loader = get_data_loader()
+    for prefetched, expected in zip(CUDAPrefetcher(data_loader, DEVICE, keys=("A", "B")),
+                                    data_loader):
+        assert prefetched["A"].device.type == "cuda"
+        assert prefetched["B"].device.type == "cuda"
+        metadata, expected_metadata = prefetched["metadata"], expected["metadata"]
+        assert metadata["patient_id"] == expected_metadata["patient_id"]
+        # Collated lists of tensors stay as they are, on CPU
+        assert isinstance(metadata["spacing"], list)
+        for value, expected_value in zip(metadata["spacing"], expected_metadata["spacing"]):
+            assert value.device.type == "cpu"
+            assert torch.equal(value, expected_value)
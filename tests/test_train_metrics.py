@@ -0,0 +1,30 @@
+import torch
+from omegaconf import OmegaConf
+
+from ganslate.utils.metrics.train_metrics import TrainingMetrics
+
+
+def get_training_metrics(discriminator_evolution=True):
+    conf = OmegaConf.create(
+        {"train": {"metrics": {"discriminator_evolution": discriminator_evolution, "ssim": False}}})
+    return TrainingMetrics(conf)
+
+
+def test_output_metric_D_for_dict_output():
+    # E.g. a multi-scale discriminator, with an output per scale
+    out = {"scale_1": torch.full((2, 1, 4, 4), 1.), "scale_2": torch.full((2, 1, 2, 2), 3.)}
+    metric = get_training_metrics().get_output_metric_D(out)
+    assert metric is not None
+    assert metric.dim() == 0
+    assert torch.isclose(metric, torch.tensor(2.))
+
+
+def test_output_metric_D_for_tensor_output():
+    out = torch.arange(8, dtype=torch.float).view(2, 1, 2, 2)
+    metric = get_training_metrics().get_output_metric_D(out)
+    assert torch.isclose(metric, torch.tensor(3.5))
+
+
+def test_output_metric_D_disabled():
+    out = torch.ones(2, 1, 4, 4)
+    assert get_training_metrics(discriminator_evolution=False).get_output_metric_D(out) is None